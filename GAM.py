@@ -1,10 +1,10 @@
+import math
 import numpy as np
-from sklearn.decomposition import PCA
-from sklearn.linear_model import LinearRegression
-from sklearn.preprocessing import PolynomialFeatures
-from sklearn.metrics import mean_squared_error
+from numba import njit
 from pygam import LinearGAM, s, l
+from joblib import Parallel, delayed
 import pandas as pd
+import orjson
 
 # Generate sample data
 np.random.seed(42)
@@ -12,42 +12,144 @@ X = np.random.rand(100000, 3)
 y = np.sin(12 * X[:, 0]) + X[:, 1] - X[:, 2]**2 + np.random.randn(100000) * 0.2
 
 # Step 1: Decouple the features using PCA
-pca = PCA()
-X_transformed = pca.fit_transform(X)
+# Eigendecomposition of the small scatter matrix; components in descending variance
+# order with the largest-magnitude entry of each made positive (as svd_flip does)
+pca_mean = X.mean(axis=0)
+Xc = X - pca_mean
+eigvals, eigvecs = np.linalg.eigh(Xc.T @ Xc)
+pca_components = eigvecs[:, ::-1].T
+rows = np.arange(pca_components.shape[0])
+pca_components *= np.sign(pca_components[rows, np.abs(pca_components).argmax(axis=1)])[:, None]
+X_transformed = Xc @ pca_components.T
 
 # Step 2 & 3: Identify individual relationships and select best transformation
+TRANSFORMATIONS = ['linear', 'exponential', 'logarithmic', 'polynomial']
+# Fewest rows with y > 0 (exponential) or x > 0 (logarithmic) to fit that model
+MIN_FIT_SAMPLES = 10
+# Relative size below which a normal-equation pivot counts as zero (e.g. constant x)
+SINGULAR_TOL = 1e-12
+
+@njit(cache=True)
+def _line_fit(n, Su, Suu, St, Sut):
+    # Closed-form 2x2 normal equations for t = a + b*u; a constant u has no slope,
+    # so the best line is the mean of t
+    den = n * Suu - Su * Su
+    if den <= SINGULAR_TOL * n * Suu:
+        return St / n, 0.0
+    slope = (n * Sut - Su * St) / den
+    intercept = (St - slope * Su) / n
+    return intercept, slope
+
+@njit(cache=True)
+def _quad_fit(n, S1, S2, S3, S4, Sy, S1y, S2y):
+    # Cholesky solve of the 3x3 normal equations for y = a + b*x + c*x^2. They are
+    # singular when x takes fewer than three values; ok is False then
+    l00 = math.sqrt(n)
+    l10 = S1 / l00
+    l20 = S2 / l00
+    d11 = S2 - l10 * l10
+    if d11 <= SINGULAR_TOL * S2:
+        return False, 0.0, 0.0, 0.0
+    l11 = math.sqrt(d11)
+    l21 = (S3 - l20 * l10) / l11
+    d22 = S4 - l20 * l20 - l21 * l21
+    if d22 <= SINGULAR_TOL * S4:
+        return False, 0.0, 0.0, 0.0
+    l22 = math.sqrt(d22)
+    z0 = Sy / l00
+    z1 = (S1y - l10 * z0) / l11
+    z2 = (S2y - l20 * z0 - l21 * z1) / l22
+    c = z2 / l22
+    b = (z1 - l21 * c) / l11
+    a = (z0 - l10 * b - l20 * c) / l00
+    return True, a, b, c
+
+# Compiled eagerly for contiguous float64 input and cached on disk, so later runs
+# skip the JIT entirely. fastmath without 'nnan'/'ninf', since inf marks a model
+# that could not be fitted.
+@njit('int64(float64[::1], float64[::1])', cache=True, boundscheck=False,
+      fastmath={'nsz', 'arcp', 'contract', 'afn', 'reassoc'})
 def fit_transformations(x, y):
-    # Linear
-    lr = LinearRegression().fit(x.reshape(-1, 1), y)
-    y_pred_linear = lr.predict(x.reshape(-1, 1))
-    mse_linear = mean_squared_error(y, y_pred_linear)
-    
-    # Exponential
-    lr_exp = LinearRegression().fit(x.reshape(-1, 1), np.log(y))
-    y_pred_exp = np.exp(lr_exp.predict(x.reshape(-1, 1)))
-    mse_exp = mean_squared_error(y, y_pred_exp)
-    
-    # Logarithmic
-    lr_log = LinearRegression().fit(np.log(x.reshape(-1, 1)), y)
-    y_pred_log = lr_log.predict(np.log(x.reshape(-1, 1)))
-    mse_log = mean_squared_error(y, y_pred_log)
-    
-    # Polynomial
-    poly = PolynomialFeatures(degree=2)
-    X_poly = poly.fit_transform(x.reshape(-1, 1))
-    lr_poly = LinearRegression().fit(X_poly, y)
-    y_pred_poly = lr_poly.predict(X_poly)
-    mse_poly = mean_squared_error(y, y_pred_poly)
-    
-    # Select best transformation based on RMSE
-    transformations = ['linear', 'exponential', 'logarithmic', 'polynomial']
-    mse_values = [mse_linear, mse_exp, mse_log, mse_poly]
-    
-    best_transform = transformations[np.argmin(mse_values)]
-    
-    return best_transform
-
-best_transformations = [fit_transformations(X_transformed[:, i], y) for i in range(X_transformed.shape[1])]
+    n = x.shape[0]
+    # log(x) is kept for the second pass so each element's log is taken once
+    lx = np.empty(n)
+
+    # First pass: accumulate the Gram sums of all four models at once.
+    # The quadratic design [1, x, x^2] is never materialized, only its moments.
+    # The exponential fit only sees rows with y > 0 and the logarithmic fit only
+    # rows with x > 0, each with its own row count.
+    Sx = Sxx = Sx3 = Sx4 = 0.0
+    Sy = Sxy = Sx2y = 0.0
+    n_log = 0
+    Slx = Slxlx = Sy_log = Slxy = 0.0
+    n_exp = 0
+    Sx_exp = Sxx_exp = Sly = Sxly = 0.0
+    for i in range(n):
+        xi = x[i]
+        yi = y[i]
+        x2 = xi * xi
+        Sx += xi
+        Sxx += x2
+        Sx3 += x2 * xi
+        Sx4 += x2 * x2
+        Sy += yi
+        Sxy += xi * yi
+        Sx2y += x2 * yi
+        if xi > 0.0:
+            lxi = math.log(xi)
+            lx[i] = lxi
+            n_log += 1
+            Slx += lxi
+            Slxlx += lxi * lxi
+            Sy_log += yi
+            Slxy += lxi * yi
+        if yi > 0.0:
+            lyi = math.log(yi)
+            n_exp += 1
+            Sx_exp += xi
+            Sxx_exp += x2
+            Sly += lyi
+            Sxly += xi * lyi
+
+    a_lin, b_lin = _line_fit(n, Sx, Sxx, Sy, Sxy)
+    use_poly, a_poly, b_poly, c_poly = _quad_fit(n, Sx, Sxx, Sx3, Sx4, Sy, Sxy, Sx2y)
+    use_exp = n_exp >= MIN_FIT_SAMPLES
+    if use_exp:
+        a_exp, b_exp = _line_fit(n_exp, Sx_exp, Sxx_exp, Sly, Sxly)
+    use_log = n_log >= MIN_FIT_SAMPLES
+    if use_log:
+        a_log, b_log = _line_fit(n_log, Slx, Slxlx, Sy_log, Slxy)
+
+    # Second pass: squared error of every model's prediction over all n rows, so the
+    # models are compared on the same rows. The logarithmic model is undefined where
+    # x <= 0 and is charged the error of the mean of y there.
+    y_mean = Sy / n
+    sse_linear = sse_exp = sse_log = sse_poly = 0.0
+    for i in range(n):
+        xi = x[i]
+        yi = y[i]
+        r = yi - (a_lin + b_lin * xi)
+        sse_linear += r * r
+        if use_poly:
+            r = yi - (a_poly + (b_poly + c_poly * xi) * xi)
+            sse_poly += r * r
+        if use_exp:
+            r = yi - math.exp(a_exp + b_exp * xi)
+            sse_exp += r * r
+        if use_log:
+            r = yi - (a_log + b_log * lx[i] if xi > 0.0 else y_mean)
+            sse_log += r * r
+
+    # Select best transformation based on RMSE; index into TRANSFORMATIONS.
+    # A model that could not be fitted is never selected.
+    mse_exp = sse_exp / n if use_exp else np.inf
+    mse_log = sse_log / n if use_log else np.inf
+    mse_poly = sse_poly / n if use_poly else np.inf
+    return np.argmin(np.array([sse_linear / n, mse_exp, mse_log, mse_poly]))
+
+# One contiguous row per component, as the compiled signature requires
+X_components = np.ascontiguousarray(X_transformed.T)
+best_transformations = [TRANSFORMATIONS[fit_transformations(x, y)] for x in X_components]
 
 # Step 4: Formulate the GAM
 terms = []
@@ -60,7 +162,15 @@ for i, transform in enumerate(best_transformations):
 print(f"Formulated GAM: f(x) = {' + '.join([str(term) for term in terms])}")
 
 # Step 5: Train the GAM
-gam = LinearGAM(terms).fit(X_transformed, y)
+# Grid points are independent fits, so tune the smoothing penalty across processes
+# and keep the model with the lowest GCV (what LinearGAM.gridsearch minimizes)
+def fit_gam(terms, lam, X, y):
+    gam = LinearGAM(terms, lam=lam).fit(X, y)
+    return gam.statistics_['GCV'], gam
+
+lam_grid = np.logspace(-3, 3, 11)
+fits = Parallel(n_jobs=-1)(delayed(fit_gam)(terms, lam, X_transformed, y) for lam in lam_grid)
+gam = min(fits, key=lambda fit: fit[0])[1]
 
 # Inference out the GAM equation
 print("GAM equation:")
@@ -79,13 +189,16 @@ score = gam._estimate_r2(X_transformed, y)
 print(f"R^2 Score: {score['explained_deviance']:.3f}")
 
 # Export the PCA fit parameters and the GAM model for external inferencing
+# orjson encodes C-contiguous NumPy arrays directly; anything else, such as the
+# strided diagonal views in gam.statistics_, falls through to default as a list
 export_data = {
-    "PCA_mean": pca.mean_.tolist(),
-    "PCA_components": pca.components_.tolist(),
-    "GAM_coefficients": gam.coef_.tolist(),
+    "PCA_mean": pca_mean,
+    "PCA_components": np.ascontiguousarray(pca_components),
+    "GAM_coefficients": gam.coef_,
     "GAM_stats": gam.statistics_,
     "R2_score": score
 }
 
-with open("model_parameters.json", "w") as outfile:
-    json.dump(export_data, outfile)
+with open("model_parameters.json", "wb") as outfile:
+    outfile.write(orjson.dumps(export_data, default=lambda obj: np.asarray(obj).tolist(),
+                               option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS))
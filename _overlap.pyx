@@ -0,0 +1,41 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+# Cython build of overlapcheck.is_overlap, used instead of the Numba kernel when
+# OVERLAP_CYTHON=1 is set and it compiles, so there is no JIT warm-up at startup.
+# It is a line-for-line port; the derivation is commented on is_overlap.
+
+from libc.math cimport fabs, hypot
+
+
+cpdef bint is_overlap(double cx1, double cy1, double c1, double s1,
+                      double lf1, double wl1, double lr1, double wr1,
+                      double cx2, double cy2, double c2, double s2,
+                      double lf2, double wl2, double lr2, double wr2) noexcept nogil:
+    """Separating axis test, c/s being the precomputed cos/sin of each angle."""
+    cdef double dx, dy, r, cd, sd
+    cdef bint separated
+    cdef double hx1, hy1, hx2, hy2, mx1, my1, mx2, my2
+
+    dx = cx2 - cx1
+    dy = cy2 - cy1
+    r = hypot(max(lf1, lr1), max(wl1, wr1)) + hypot(max(lf2, lr2), max(wl2, wr2))
+    if dx * dx + dy * dy > r * r:
+        return False
+
+    hx1 = (lf1 + lr1) * 0.5
+    hy1 = (wl1 + wr1) * 0.5
+    hx2 = (lf2 + lr2) * 0.5
+    hy2 = (wl2 + wr2) * 0.5
+    mx1 = (lf1 - lr1) * 0.5
+    my1 = (wl1 - wr1) * 0.5
+    mx2 = (lf2 - lr2) * 0.5
+    my2 = (wl2 - wr2) * 0.5
+    dx += (c2 * mx2 - s2 * my2) - (c1 * mx1 - s1 * my1)
+    dy += (s2 * mx2 + c2 * my2) - (s1 * mx1 + c1 * my1)
+
+    cd = fabs(c1 * c2 + s1 * s2)
+    sd = fabs(c1 * s2 - s1 * c2)
+    separated = ((fabs(dx * c1 + dy * s1) > hx1 + hx2 * cd + hy2 * sd) |
+                 (fabs(dy * c1 - dx * s1) > hy1 + hx2 * sd + hy2 * cd) |
+                 (fabs(dx * c2 + dy * s2) > hx2 + hx1 * cd + hy1 * sd) |
+                 (fabs(dy * c2 - dx * s2) > hy2 + hx1 * sd + hy1 * cd))
+    return not separated
@@ -1,79 +1,187 @@
+import os
 import cv2
+import numpy as np
 import concurrent.futures
-
-def detect_objects(frame, cascade):
-    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-    objects = cascade.detectMultiScale(gray, scaleFactor=1.1, minNeighbors=5, minSize=(30, 30))
+import multiprocessing
+import queue
+import threading
+from contextlib import nullcontext
+from multiprocessing import shared_memory
+
+# Parallelism is one cascade per worker process, so keep OpenCV itself single
+# threaded to avoid oversubscribing the cores; OpenCL dispatch gains nothing here
+cv2.setNumThreads(1)
+cv2.ocl.setUseOpenCL(False)
+
+# Pre-trained classifiers for cars, pedestrians, bicycles, and motorbikes
+CASCADE_FILES = {
+    'car': 'haarcascade_car.xml',
+    'pedestrian': 'haarcascade_fullbody.xml',
+    'bicycle': 'haarcascade_bicycle.xml',
+    'motorbike': 'haarcascade_motorbike.xml',
+}
+
+# Mean absolute difference (0-255) between 32x32 gray thumbnails below which a
+# frame counts as unchanged and the previous detections are reused
+STATIC_FRAME_THRESHOLD = 2.0
+
+# Cascades of the current worker process, loaded once by init_worker
+_cascades = {}
+
+def init_worker():
+    for name, filename in CASCADE_FILES.items():
+        _cascades[name] = cv2.CascadeClassifier(cv2.data.haarcascades + filename)
+
+def detect_objects(shm_name, shape, name):
+    # The gray frame lives in shared memory so it is not pickled for every task
+    shm = shared_memory.SharedMemory(name=shm_name)
+    gray = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf)
+    objects = _cascades[name].detectMultiScale(gray, scaleFactor=1.1, minNeighbors=5, minSize=(30, 30))
+    del gray
+    shm.close()
     return len(objects)
 
-def count_objects(video_path, skip_factor=10):
-    # Load the pre-trained classifiers for cars, pedestrians, bicycles, and motorbikes
-    car_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_car.xml')
-    pedestrian_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_fullbody.xml')
-    bicycle_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_bicycle.xml')
-    motorbike_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_motorbike.xml')
-
-    # Open the video file
-    video = cv2.VideoCapture(video_path)
-
-    car_count = 0
-    pedestrian_count = 0
-    bicycle_count = 0
-    motorbike_count = 0
-    frame_count = 0
-
-    # Read the video frame by frame
-    while video.isOpened():
+def load_cuda_cascades():
+    cascades = {}
+    for name, filename in CASCADE_FILES.items():
+        cascade = cv2.cuda_CascadeClassifier.create(cv2.data.haarcascades + filename)
+        cascade.setScaleFactor(1.1)
+        cascade.setMinNeighbors(5)
+        cascade.setMinObjectSize((30, 30))
+        cascades[name] = cascade
+    return cascades
+
+def detect_objects_cuda(gpu_gray, cascades, streams):
+    # Each cascade runs on its own CUDA stream so the four detections overlap
+    gpu_objects = {name: cascade.detectMultiScale(gpu_gray, stream=streams[name])
+                   for name, cascade in cascades.items()}
+    counts = {}
+    for name, objects in gpu_objects.items():
+        streams[name].waitForCompletion()
+        counts[name] = len(cascades[name].convert(objects))
+    return counts
+
+def read_frames(video, skip_factor, frames, stop):
+    # Producer: decode every skip_factor-th frame into the queue, None marks the end
+    while video.isOpened() and not stop.is_set():
         ret, frame = video.read()
         if not ret:
             break
+        frames.put(frame)
+
+        # Skip frames based on the skip factor; grab() advances without decoding
+        for _ in range(skip_factor - 1):
+            if not video.grab():
+                break
+    frames.put(None)
+
+def count_objects(video_path, skip_factor=10):
+    # Open the video file
+    video = cv2.VideoCapture(video_path)
 
-        # Skip frames based on the skip factor
-        if frame_count % skip_factor != 0:
-            frame_count += 1
-            continue
-
-        # Resize the frame for faster processing
-        resized_frame = cv2.resize(frame, None, fx=0.5, fy=0.5)
-
-        # Create a thread pool for parallel processing of object detection
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            futures = []
-
-            # Submit object detection tasks for each cascade classifier
-            futures.append(executor.submit(detect_objects, resized_frame, car_cascade))
-            futures.append(executor.submit(detect_objects, resized_frame, pedestrian_cascade))
-            futures.append(executor.submit(detect_objects, resized_frame, bicycle_cascade))
-            futures.append(executor.submit(detect_objects, resized_frame, motorbike_cascade))
-
-            # Wait for the tasks to complete and retrieve the results
-            for future in concurrent.futures.as_completed(futures):
-                result = future.result()
-                if cascade == car_cascade:
-                    car_count += result
-                elif cascade == pedestrian_cascade:
-                    pedestrian_count += result
-                elif cascade == bicycle_cascade:
-                    bicycle_count += result
-                elif cascade == motorbike_cascade:
-                    motorbike_count += result
-
-        frame_count += 1
-
-    # Release the video capture
-    video.release()
+    counts = dict.fromkeys(CASCADE_FILES, 0)
+    resized_frame = None
+    shm = None
+    last_thumb = None
+
+    # Run the cascades on the GPU when OpenCV was built with CUDA and a device is present
+    use_cuda = cv2.cuda.getCudaEnabledDeviceCount() > 0
+    if use_cuda:
+        cuda_cascades = load_cuda_cascades()
+        streams = {name: cv2.cuda_Stream() for name in CASCADE_FILES}
+        gpu_frame = cv2.cuda_GpuMat()
+        gpu_gray = cv2.cuda_GpuMat()
+
+    # Otherwise a process pool for parallel object detection, one cascade per task.
+    # The workers start lazily on the first submit, after the reader thread is
+    # running, so they are spawned rather than forked from a threaded process
+    pool = nullcontext() if use_cuda else concurrent.futures.ProcessPoolExecutor(
+        max_workers=min(len(CASCADE_FILES), os.cpu_count()), initializer=init_worker,
+        mp_context=multiprocessing.get_context('spawn'))
+
+    # Decode on a separate thread so it overlaps with detection
+    frames = queue.Queue(maxsize=4)
+    stop = threading.Event()
+    reader = threading.Thread(target=read_frames, args=(video, skip_factor, frames, stop), daemon=True)
+    reader.start()
+
+    try:
+        with pool as executor:
+            while True:
+                frame = frames.get()
+                if frame is None:
+                    break
+
+                # Work buffers are allocated on the first frame and reused for the whole
+                # video; the gray frame goes straight into the shared memory block
+                if resized_frame is None:
+                    height, width = frame.shape[:2]
+                    size = (width // 2, height // 2)
+                    shape = (height // 2, width // 2)
+                    resized_frame = np.empty(shape + (3,), dtype=np.uint8)
+                    if not use_cuda:
+                        shm = shared_memory.SharedMemory(create=True, size=shape[0] * shape[1])
+                        gray = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf)
+
+                # Resize the frame for faster processing
+                cv2.resize(frame, size, dst=resized_frame)
+
+                # Skip detection on static scenes: compare a tiny thumbnail against the
+                # last frame that was actually detected
+                thumb = cv2.cvtColor(cv2.resize(resized_frame, (32, 32), interpolation=cv2.INTER_AREA),
+                                     cv2.COLOR_BGR2GRAY)
+                static = last_thumb is not None and cv2.absdiff(thumb, last_thumb).mean() < STATIC_FRAME_THRESHOLD
+
+                if static:
+                    # frame_counts still holds the detections of the last changed frame
+                    pass
+                elif use_cuda:
+                    last_thumb = thumb
+                    gpu_frame.upload(resized_frame)
+                    cv2.cuda.cvtColor(gpu_frame, cv2.COLOR_BGR2GRAY, gpu_gray)
+                    frame_counts = detect_objects_cuda(gpu_gray, cuda_cascades, streams)
+                else:
+                    last_thumb = thumb
+
+                    # Convert to grayscale once, shared by all cascades
+                    cv2.cvtColor(resized_frame, cv2.COLOR_BGR2GRAY, dst=gray)
+
+                    # Submit object detection tasks for each cascade classifier
+                    futures = {name: executor.submit(detect_objects, shm.name, shape, name)
+                               for name in CASCADE_FILES}
+
+                    # Wait for the tasks to complete and retrieve the results
+                    frame_counts = {name: future.result() for name, future in futures.items()}
+
+                for name, count in frame_counts.items():
+                    counts[name] += count
+    finally:
+        # Stop the reader, draining the queue so a blocked put() can return, then
+        # release the video capture and the shared frame buffer even on error
+        stop.set()
+        while reader.is_alive():
+            try:
+                frames.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        video.release()
+        if shm is not None:
+            del gray
+            shm.close()
+            shm.unlink()
 
     # Print the counts of cars, pedestrians, bicycles, and motorbikes
-    print('Number of cars:', car_count)
-    print('Number of pedestrians:', pedestrian_count)
-    print('Number of bicycles:', bicycle_count)
-    print('Number of motorbikes:', motorbike_count)
+    print('Number of cars:', counts['car'])
+    print('Number of pedestrians:', counts['pedestrian'])
+    print('Number of bicycles:', counts['bicycle'])
+    print('Number of motorbikes:', counts['motorbike'])
 
-# Provide the path to the video file
-video_path = 'path/to/your/video/file.mp4'
+if __name__ == '__main__':
+    # Provide the path to the video file
+    video_path = 'path/to/your/video/file.mp4'
 
-# Specify the skip factor (optional, default is 10)
-skip_factor = 10
+    # Specify the skip factor (optional, default is 10)
+    skip_factor = 10
 
-# Call the function to count objects in the video
-count_objects(video_path, skip_factor)
+    # Call the function to count objects in the video
+    count_objects(video_path, skip_factor)
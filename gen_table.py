@@ -0,0 +1,461 @@
+import os
+import re
+import numpy as np
+
+# Test vector table of the C implementation, as its C initializer: one row per
+# caller() case, (cx1, cy1, o1, lf1, wl1, lr1, wr1, cx2, cy2, o2, lf2, wl2, lr2, wr2, type)
+C_TABLE = '''
+t = (
+(2  , 4 , 0.00f, 1, 1, 1, 2, 03.00f, 4.00f, 0.00f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(2  , 10, 0.00f, 1, 1, 1, 2, 03.00f, 10.0f, 0.00f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(2  , 14, 0.00f, 1, 1, 1, 2, 03.00f, 14.0f, 0.00f, 1.0f, 0.50f, 0.50f, 0.50f, TYP),
+(2  , 18, 0.00f, 1, 1, 1, 2, 03.00f, 18.0f, 0.00f, 1.0f, 0.50f, 0.30f, 0.30f, TYP),
+(2  , 26, 0.00f, 1, 1, 1, 2, 03.00f, 26.0f, 0.00f, 1.0f, 4.00f, 1.00f, 4.00f, TYP),
+(2  , 38, 0.00f, 1, 1, 1, 2, 03.00f, 38.0f, 0.00f, 1.0f, 5.00f, 1.00f, 5.00f, TYP),
+(2  , 48, 0.00f, 1, 1, 1, 2, 03.00f, 48.0f, 0.00f, 0.5f, 0.50f, 0.50f, 2.00f, TYP),
+(2  , 54, 0.00f, 1, 1, 1, 2, 03.00f, 54.0f, 0.00f, 0.2f, 0.50f, 0.20f, 2.00f, TYP),
+(2  , 60, 0.00f, 1, 1, 1, 2, 05.00f, 60.0f, 0.00f, 3.0f, 1.00f, 3.00f, 1.00f, TYP),
+(2  , 66, 0.00f, 1, 1, 1, 2, 06.00f, 66.0f, 0.00f, 4.0f, 1.00f, 4.00f, 1.00f, TYP),
+(2  , 74, 0.00f, 1, 1, 1, 2, 07.00f, 74.0f, 0.00f, 5.0f, 1.00f, 5.00f, 1.00f, TYP),
+(14 , 4 , 0.00f, 1, 1, 1, 2, 015.0f, 5.00f, 0.00f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(14 , 10, 0.00f, 1, 1, 1, 2, 015.0f, 11.0f, 0.00f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(14 , 14, 0.00f, 1, 1, 1, 2, 015.0f, 15.0f, 0.00f, 1.0f, 0.50f, 0.50f, 0.50f, TYP),
+(14 , 18, 0.00f, 1, 1, 1, 2, 015.0f, 19.0f, 0.00f, 1.0f, 0.50f, 0.30f, 0.30f, TYP),
+(14 , 26, 0.00f, 1, 1, 1, 2, 015.0f, 27.0f, 0.00f, 1.0f, 4.00f, 1.00f, 4.00f, TYP),
+(14 , 38, 0.00f, 1, 1, 1, 2, 015.0f, 39.0f, 0.00f, 1.0f, 5.00f, 1.00f, 5.00f, TYP),
+(14 , 48, 0.00f, 1, 1, 1, 2, 015.0f, 49.0f, 0.00f, 0.5f, 0.50f, 0.50f, 2.00f, TYP),
+(14 , 54, 0.00f, 1, 1, 1, 2, 015.0f, 55.0f, 0.00f, 0.2f, 0.50f, 0.20f, 2.00f, TYP),
+(14 , 60, 0.00f, 1, 1, 1, 2, 017.0f, 61.0f, 0.00f, 3.0f, 1.00f, 3.00f, 1.00f, TYP),
+(14 , 66, 0.00f, 1, 1, 1, 2, 018.0f, 67.0f, 0.00f, 4.0f, 1.00f, 4.00f, 1.00f, TYP),
+(14 , 74, 0.00f, 1, 1, 1, 2, 019.0f, 75.0f, 0.00f, 5.0f, 1.00f, 5.00f, 1.00f, TYP),
+(26 , 4 , 0.00f, 1, 1, 1, 2, 027.0f, 3.00f, 0.00f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(26 , 10, 0.00f, 1, 1, 1, 2, 027.0f, 9.00f, 0.00f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(26 , 14, 0.00f, 1, 1, 1, 2, 027.0f, 13.0f, 0.00f, 1.0f, 0.50f, 0.50f, 0.50f, TYP),
+(26 , 18, 0.00f, 1, 1, 1, 2, 027.0f, 17.0f, 0.00f, 1.0f, 0.50f, 0.30f, 0.30f, TYP),
+(26 , 26, 0.00f, 1, 1, 1, 2, 027.0f, 25.0f, 0.00f, 1.0f, 4.00f, 1.00f, 4.00f, TYP),
+(26 , 38, 0.00f, 1, 1, 1, 2, 027.0f, 37.0f, 0.00f, 1.0f, 5.00f, 1.00f, 5.00f, TYP),
+(26 , 48, 0.00f, 1, 1, 1, 2, 027.0f, 47.0f, 0.00f, 0.5f, 0.50f, 0.50f, 2.00f, TYP),
+(26 , 54, 0.00f, 1, 1, 1, 2, 027.0f, 53.0f, 0.00f, 0.2f, 0.50f, 0.20f, 2.00f, TYP),
+(26 , 60, 0.00f, 1, 1, 1, 2, 029.0f, 59.0f, 0.00f, 3.0f, 1.00f, 3.00f, 1.00f, TYP),
+(26 , 66, 0.00f, 1, 1, 1, 2, 030.0f, 65.0f, 0.00f, 4.0f, 1.00f, 4.00f, 1.00f, TYP),
+(26 , 74, 0.00f, 1, 1, 1, 2, 031.0f, 73.0f, 0.00f, 5.0f, 1.00f, 5.00f, 1.00f, TYP),
+(48 , 4 , 0.00f, 1, 1, 1, 2, 047.0f, 4.00f, 0.00f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(48 , 10, 0.00f, 1, 1, 1, 2, 047.0f, 10.0f, 0.00f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(48 , 14, 0.00f, 1, 1, 1, 2, 047.0f, 14.0f, 0.00f, 1.0f, 0.50f, 0.50f, 0.50f, TYP),
+(48 , 18, 0.00f, 1, 1, 1, 2, 047.0f, 18.0f, 0.00f, 1.0f, 0.50f, 0.30f, 0.30f, TYP),
+(48 , 26, 0.00f, 1, 1, 1, 2, 047.0f, 26.0f, 0.00f, 1.0f, 4.00f, 1.00f, 4.00f, TYP),
+(48 , 38, 0.00f, 1, 1, 1, 2, 047.0f, 38.0f, 0.00f, 1.0f, 5.00f, 1.00f, 5.00f, TYP),
+(48 , 48, 0.00f, 1, 1, 1, 2, 047.0f, 48.0f, 0.00f, 0.5f, 0.50f, 0.50f, 2.00f, TYP),
+(48 , 54, 0.00f, 1, 1, 1, 2, 047.0f, 54.0f, 0.00f, 0.2f, 0.50f, 0.20f, 2.00f, TYP),
+(48 , 60, 0.00f, 1, 1, 1, 2, 045.0f, 60.0f, 0.00f, 3.0f, 1.00f, 3.00f, 1.00f, TYP),
+(48 , 66, 0.00f, 1, 1, 1, 2, 044.0f, 66.0f, 0.00f, 4.0f, 1.00f, 4.00f, 1.00f, TYP),
+(48 , 74, 0.00f, 1, 1, 1, 2, 043.0f, 74.0f, 0.00f, 5.0f, 1.00f, 5.00f, 1.00f, TYP),
+(60 , 4 , 3.14f, 1, 1, 1, 2, 061.0f, 4.00f, 3.14f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(60 , 10, 3.14f, 1, 1, 1, 2, 061.0f, 10.0f, 3.14f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(60 , 14, 3.14f, 1, 1, 1, 2, 061.0f, 14.0f, 3.14f, 1.0f, 0.50f, 0.50f, 0.50f, TYP),
+(60 , 18, 3.14f, 1, 1, 1, 2, 061.0f, 18.0f, 3.14f, 1.0f, 0.50f, 0.30f, 0.30f, TYP),
+(60 , 26, 3.14f, 1, 1, 1, 2, 061.0f, 26.0f, 3.14f, 1.0f, 4.00f, 1.00f, 4.00f, TYP),
+(60 , 38, 3.14f, 1, 1, 1, 2, 061.0f, 38.0f, 3.14f, 1.0f, 5.00f, 1.00f, 5.00f, TYP),
+(60 , 48, 3.14f, 1, 1, 1, 2, 061.0f, 48.0f, 3.14f, 0.5f, 0.50f, 0.50f, 2.00f, TYP),
+(60 , 54, 3.14f, 1, 1, 1, 2, 061.0f, 54.0f, 3.14f, 0.2f, 0.50f, 0.20f, 2.00f, TYP),
+(60 , 60, 3.14f, 1, 1, 1, 2, 063.0f, 60.0f, 3.14f, 3.0f, 1.00f, 3.00f, 1.00f, TYP),
+(60 , 66, 3.14f, 1, 1, 1, 2, 064.0f, 66.0f, 3.14f, 4.0f, 1.00f, 4.00f, 1.00f, TYP),
+(60 , 74, 3.14f, 1, 1, 1, 2, 065.0f, 74.0f, 3.14f, 5.0f, 1.00f, 5.00f, 1.00f, TYP),
+(72 , 4 , 3.14f, 1, 1, 1, 2, 073.0f, 4.00f, 2.97f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(72 , 10, 3.14f, 1, 1, 1, 2, 073.0f, 10.0f, 2.97f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(72 , 14, 3.14f, 1, 1, 1, 2, 073.0f, 14.0f, 2.97f, 1.0f, 0.50f, 0.50f, 0.50f, TYP),
+(72 , 18, 3.14f, 1, 1, 1, 2, 073.0f, 18.0f, 2.97f, 1.0f, 0.50f, 0.30f, 0.30f, TYP),
+(72 , 26, 3.14f, 1, 1, 1, 2, 073.0f, 26.0f, 2.97f, 1.0f, 4.00f, 1.00f, 4.00f, TYP),
+(72 , 38, 3.14f, 1, 1, 1, 2, 073.0f, 38.0f, 2.97f, 1.0f, 5.00f, 1.00f, 5.00f, TYP),
+(72 , 48, 3.14f, 1, 1, 1, 2, 073.0f, 48.0f, 2.97f, 0.5f, 0.50f, 0.50f, 2.00f, TYP),
+(72 , 54, 3.14f, 1, 1, 1, 2, 073.0f, 54.0f, 2.97f, 0.2f, 0.50f, 0.20f, 2.00f, TYP),
+(72 , 60, 3.14f, 1, 1, 1, 2, 075.0f, 60.0f, 2.97f, 3.0f, 1.00f, 3.00f, 1.00f, TYP),
+(72 , 66, 3.14f, 1, 1, 1, 2, 076.0f, 66.0f, 2.97f, 4.0f, 1.00f, 4.00f, 1.00f, TYP),
+(72 , 74, 3.14f, 1, 1, 1, 2, 077.0f, 74.0f, 2.97f, 5.0f, 1.00f, 5.00f, 1.00f, TYP),
+(84 , 4 , 3.14f, 1, 1, 1, 2, 085.0f, 4.00f, 2.79f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(84 , 10, 3.14f, 1, 1, 1, 2, 085.0f, 10.0f, 2.79f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(84 , 14, 3.14f, 1, 1, 1, 2, 085.0f, 14.0f, 2.79f, 1.0f, 0.50f, 0.50f, 0.50f, TYP),
+(84 , 18, 3.14f, 1, 1, 1, 2, 085.0f, 18.0f, 2.79f, 1.0f, 0.50f, 0.30f, 0.30f, TYP),
+(84 , 26, 3.14f, 1, 1, 1, 2, 085.0f, 26.0f, 2.79f, 1.0f, 4.00f, 1.00f, 4.00f, TYP),
+(84 , 38, 3.14f, 1, 1, 1, 2, 085.0f, 38.0f, 2.79f, 1.0f, 5.00f, 1.00f, 5.00f, TYP),
+(84 , 48, 3.14f, 1, 1, 1, 2, 085.0f, 48.0f, 2.79f, 0.5f, 0.50f, 0.50f, 2.00f, TYP),
+(84 , 54, 3.14f, 1, 1, 1, 2, 085.0f, 54.0f, 2.79f, 0.2f, 0.50f, 0.20f, 2.00f, TYP),
+(84 , 60, 3.14f, 1, 1, 1, 2, 087.0f, 60.0f, 2.79f, 3.0f, 1.00f, 3.00f, 1.00f, TYP),
+(84 , 66, 3.14f, 1, 1, 1, 2, 088.0f, 66.0f, 2.79f, 4.0f, 1.00f, 4.00f, 1.00f, TYP),
+(84 , 74, 3.14f, 1, 1, 1, 2, 089.0f, 74.0f, 2.79f, 5.0f, 1.00f, 5.00f, 1.00f, TYP),
+(96 , 4 , 3.14f, 1, 1, 1, 2, 097.0f, 4.00f, 2.62f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(96 , 10, 3.14f, 1, 1, 1, 2, 097.0f, 10.0f, 2.62f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(96 , 14, 3.14f, 1, 1, 1, 2, 097.0f, 14.0f, 2.62f, 1.0f, 0.50f, 0.50f, 0.50f, TYP),
+(96 , 18, 3.14f, 1, 1, 1, 2, 097.0f, 18.0f, 2.62f, 1.0f, 0.50f, 0.30f, 0.30f, TYP),
+(96 , 26, 3.14f, 1, 1, 1, 2, 097.0f, 26.0f, 2.62f, 1.0f, 4.00f, 1.00f, 4.00f, TYP),
+(96 , 38, 3.14f, 1, 1, 1, 2, 097.0f, 38.0f, 2.62f, 1.0f, 5.00f, 1.00f, 5.00f, TYP),
+(96 , 48, 3.14f, 1, 1, 1, 2, 097.0f, 48.0f, 2.62f, 0.5f, 0.50f, 0.50f, 2.00f, TYP),
+(96 , 54, 3.14f, 1, 1, 1, 2, 097.0f, 54.0f, 2.62f, 0.2f, 0.50f, 0.20f, 2.00f, TYP),
+(96 , 60, 3.14f, 1, 1, 1, 2, 099.0f, 60.0f, 2.62f, 3.0f, 1.00f, 3.00f, 1.00f, TYP),
+(96 , 66, 3.14f, 1, 1, 1, 2, 100.0f, 66.0f, 2.62f, 4.0f, 1.00f, 4.00f, 1.00f, TYP),
+(96 , 74, 3.14f, 1, 1, 1, 2, 100.0f, 74.0f, 2.62f, 5.0f, 1.00f, 5.00f, 1.00f, TYP),
+(108, 4 , 2.36f, 1, 1, 1, 2, 109.0f, 4.00f, 2.36f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(108, 10, 2.36f, 1, 1, 1, 2, 109.0f, 10.0f, 2.36f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(108, 14, 2.36f, 1, 1, 1, 2, 109.0f, 14.0f, 2.36f, 1.0f, 0.50f, 0.50f, 0.50f, TYP),
+(108, 18, 2.36f, 1, 1, 1, 2, 109.0f, 18.0f, 2.36f, 1.0f, 0.50f, 0.30f, 0.30f, TYP),
+(108, 26, 2.36f, 1, 1, 1, 2, 109.0f, 26.0f, 2.36f, 1.0f, 4.00f, 1.00f, 4.00f, TYP),
+(108, 38, 2.36f, 1, 1, 1, 2, 109.0f, 38.0f, 2.36f, 1.0f, 5.00f, 1.00f, 5.00f, TYP),
+(108, 48, 2.36f, 1, 1, 1, 2, 109.0f, 48.0f, 2.36f, 0.5f, 0.50f, 0.50f, 2.00f, TYP),
+(108, 54, 2.36f, 1, 1, 1, 2, 109.0f, 54.0f, 2.36f, 0.2f, 0.50f, 0.20f, 2.00f, TYP),
+(108, 60, 2.36f, 1, 1, 1, 2, 108.5f, 60.0f, 2.36f, 3.0f, 1.00f, 3.00f, 1.00f, TYP),
+(108, 66, 2.36f, 1, 1, 1, 2, 109.5f, 66.0f, 2.36f, 4.0f, 1.00f, 4.00f, 1.00f, TYP),
+(108, 74, 2.36f, 1, 1, 1, 2, 110.5f, 74.0f, 2.36f, 5.0f, 1.00f, 5.00f, 1.00f, TYP),
+(120, 4 , 2.36f, 1, 1, 1, 2, 121.0f, 4.00f, 2.18f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(120, 10, 2.36f, 1, 1, 1, 2, 121.0f, 10.0f, 2.18f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(120, 14, 2.36f, 1, 1, 1, 2, 121.0f, 14.0f, 2.18f, 1.0f, 0.50f, 0.50f, 0.50f, TYP),
+(120, 18, 2.36f, 1, 1, 1, 2, 121.0f, 18.0f, 2.18f, 1.0f, 0.50f, 0.30f, 0.30f, TYP),
+(120, 26, 2.36f, 1, 1, 1, 2, 121.0f, 26.0f, 2.18f, 1.0f, 4.00f, 1.00f, 4.00f, TYP),
+(120, 38, 2.36f, 1, 1, 1, 2, 121.0f, 38.0f, 2.18f, 1.0f, 5.00f, 1.00f, 5.00f, TYP),
+(120, 48, 2.36f, 1, 1, 1, 2, 121.0f, 48.0f, 2.18f, 0.5f, 0.50f, 0.50f, 2.00f, TYP),
+(120, 54, 2.36f, 1, 1, 1, 2, 121.0f, 54.0f, 2.18f, 0.2f, 0.50f, 0.20f, 2.00f, TYP),
+(120, 60, 2.36f, 1, 1, 1, 2, 120.3f, 60.0f, 2.18f, 3.0f, 1.00f, 3.00f, 1.00f, TYP),
+(120, 66, 2.36f, 1, 1, 1, 2, 121.3f, 66.0f, 2.18f, 4.0f, 1.00f, 4.00f, 1.00f, TYP),
+(120, 74, 2.36f, 1, 1, 1, 2, 122.3f, 74.0f, 2.18f, 5.0f, 1.00f, 5.00f, 1.00f, TYP),
+(132, 4 , 2.36f, 1, 1, 1, 2, 133.0f, 4.00f, 2.01f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(132, 10, 2.36f, 1, 1, 1, 2, 133.0f, 10.0f, 2.01f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(132, 14, 2.36f, 1, 1, 1, 2, 133.0f, 14.0f, 2.01f, 1.0f, 0.50f, 0.50f, 0.50f, TYP),
+(132, 18, 2.36f, 1, 1, 1, 2, 133.0f, 18.0f, 2.01f, 1.0f, 0.50f, 0.30f, 0.30f, TYP),
+(132, 26, 2.36f, 1, 1, 1, 2, 133.0f, 26.0f, 2.01f, 1.0f, 4.00f, 1.00f, 4.00f, TYP),
+(132, 38, 2.36f, 1, 1, 1, 2, 133.0f, 38.0f, 2.01f, 1.0f, 5.00f, 1.00f, 5.00f, TYP),
+(132, 48, 2.36f, 1, 1, 1, 2, 133.0f, 48.0f, 2.01f, 0.5f, 0.50f, 0.50f, 2.00f, TYP),
+(132, 54, 2.36f, 1, 1, 1, 2, 133.0f, 54.0f, 2.01f, 0.2f, 0.50f, 0.20f, 2.00f, TYP),
+(132, 60, 2.36f, 1, 1, 1, 2, 132.3f, 60.0f, 2.01f, 3.0f, 1.00f, 3.00f, 1.00f, TYP),
+(132, 66, 2.36f, 1, 1, 1, 2, 133.3f, 66.0f, 2.01f, 4.0f, 1.00f, 4.00f, 1.00f, TYP),
+(132, 74, 2.36f, 1, 1, 1, 2, 134.3f, 74.0f, 2.01f, 5.0f, 1.00f, 5.00f, 1.00f, TYP),
+(144, 4 , 2.36f, 1, 1, 1, 2, 145.0f, 4.00f, 1.83f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(144, 10, 2.36f, 1, 1, 1, 2, 145.0f, 10.0f, 1.83f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(144, 14, 2.36f, 1, 1, 1, 2, 145.0f, 14.0f, 1.83f, 1.0f, 0.50f, 0.50f, 0.50f, TYP),
+(144, 18, 2.36f, 1, 1, 1, 2, 145.0f, 18.0f, 1.83f, 1.0f, 0.50f, 0.30f, 0.30f, TYP),
+(144, 26, 2.36f, 1, 1, 1, 2, 145.0f, 26.0f, 1.83f, 1.0f, 4.00f, 1.00f, 4.00f, TYP),
+(144, 38, 2.36f, 1, 1, 1, 2, 145.0f, 38.0f, 1.83f, 1.0f, 5.00f, 1.00f, 5.00f, TYP),
+(144, 48, 2.36f, 1, 1, 1, 2, 145.0f, 48.0f, 1.83f, 0.5f, 0.50f, 0.50f, 2.00f, TYP),
+(144, 54, 2.36f, 1, 1, 1, 2, 145.0f, 54.0f, 1.83f, 0.2f, 0.50f, 0.20f, 2.00f, TYP),
+(144, 60, 2.36f, 1, 1, 1, 2, 144.3f, 60.0f, 1.83f, 3.0f, 1.00f, 3.00f, 1.00f, TYP),
+(144, 66, 2.36f, 1, 1, 1, 2, 145.3f, 66.0f, 1.83f, 4.0f, 1.00f, 4.00f, 1.00f, TYP),
+(144, 74, 2.36f, 1, 1, 1, 2, 146.3f, 74.0f, 1.83f, 5.0f, 1.00f, 5.00f, 1.00f, TYP),
+(156, 4 , 1.57f, 1, 1, 1, 2, 157.0f, 3.50f, 1.57f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(156, 10, 1.57f, 1, 1, 1, 2, 157.0f, 9.50f, 1.57f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(156, 14, 1.57f, 1, 1, 1, 2, 157.0f, 13.5f, 1.57f, 1.0f, 0.50f, 0.50f, 0.50f, TYP),
+(156, 18, 1.57f, 1, 1, 1, 2, 157.0f, 17.5f, 1.57f, 1.0f, 0.50f, 0.30f, 0.30f, TYP),
+(156, 26, 1.57f, 1, 1, 1, 2, 157.0f, 25.5f, 1.57f, 1.0f, 4.00f, 1.00f, 4.00f, TYP),
+(156, 38, 1.57f, 1, 1, 1, 2, 157.0f, 37.5f, 1.57f, 1.0f, 5.00f, 1.00f, 5.00f, TYP),
+(156, 48, 1.57f, 1, 1, 1, 2, 157.0f, 48.0f, 1.57f, 0.5f, 0.50f, 0.50f, 2.00f, TYP),
+(156, 54, 1.57f, 1, 1, 1, 2, 157.0f, 54.0f, 1.57f, 0.2f, 0.50f, 0.20f, 2.00f, TYP),
+(156, 60, 1.57f, 1, 1, 1, 2, 156.3f, 60.0f, 1.57f, 3.0f, 1.00f, 3.00f, 1.00f, TYP),
+(156, 66, 1.57f, 1, 1, 1, 2, 157.3f, 66.0f, 1.57f, 4.0f, 1.00f, 4.00f, 1.00f, TYP),
+(156, 74, 1.57f, 1, 1, 1, 2, 157.5f, 74.0f, 1.57f, 5.0f, 1.00f, 5.00f, 1.00f, TYP),
+(168, 4 , 1.57f, 1, 1, 1, 2, 169.0f, 4.00f, 1.40f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(168, 10, 1.57f, 1, 1, 1, 2, 169.0f, 10.0f, 1.40f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(168, 14, 1.57f, 1, 1, 1, 2, 169.0f, 14.0f, 1.40f, 1.0f, 0.50f, 0.50f, 0.50f, TYP),
+(168, 18, 1.57f, 1, 1, 1, 2, 169.0f, 18.0f, 1.40f, 1.0f, 0.50f, 0.30f, 0.30f, TYP),
+(168, 26, 1.57f, 1, 1, 1, 2, 169.0f, 26.0f, 1.40f, 1.0f, 4.00f, 1.00f, 4.00f, TYP),
+(168, 38, 1.57f, 1, 1, 1, 2, 169.0f, 38.0f, 1.40f, 1.0f, 5.00f, 1.00f, 5.00f, TYP),
+(168, 48, 1.57f, 1, 1, 1, 2, 169.0f, 48.0f, 1.40f, 0.5f, 0.50f, 0.50f, 2.00f, TYP),
+(168, 54, 1.57f, 1, 1, 1, 2, 169.0f, 54.0f, 1.40f, 0.2f, 0.50f, 0.20f, 2.00f, TYP),
+(168, 60, 1.57f, 1, 1, 1, 2, 168.0f, 60.0f, 1.40f, 3.0f, 1.00f, 3.00f, 1.00f, TYP),
+(168, 66, 1.57f, 1, 1, 1, 2, 169.0f, 66.0f, 1.40f, 4.0f, 1.00f, 4.00f, 1.00f, TYP),
+(168, 74, 1.57f, 1, 1, 1, 2, 170.0f, 74.0f, 1.40f, 5.0f, 1.00f, 5.00f, 1.00f, TYP),
+(180, 4 , 1.57f, 1, 1, 1, 2, 181.0f, 4.00f, 1.22f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(180, 10, 1.57f, 1, 1, 1, 2, 181.0f, 10.0f, 1.22f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(180, 14, 1.57f, 1, 1, 1, 2, 181.0f, 14.0f, 1.22f, 1.0f, 0.50f, 0.50f, 0.50f, TYP),
+(180, 18, 1.57f, 1, 1, 1, 2, 181.0f, 18.0f, 1.22f, 1.0f, 0.50f, 0.30f, 0.30f, TYP),
+(180, 26, 1.57f, 1, 1, 1, 2, 181.0f, 26.0f, 1.22f, 1.0f, 4.00f, 1.00f, 4.00f, TYP),
+(180, 38, 1.57f, 1, 1, 1, 2, 181.0f, 38.0f, 1.22f, 1.0f, 5.00f, 1.00f, 5.00f, TYP),
+(180, 48, 1.57f, 1, 1, 1, 2, 181.0f, 48.0f, 1.22f, 0.5f, 0.50f, 0.50f, 2.00f, TYP),
+(180, 54, 1.57f, 1, 1, 1, 2, 181.0f, 54.0f, 1.22f, 0.2f, 0.50f, 0.20f, 2.00f, TYP),
+(180, 60, 1.57f, 1, 1, 1, 2, 180.0f, 60.0f, 1.22f, 3.0f, 1.00f, 3.00f, 1.00f, TYP),
+(180, 66, 1.57f, 1, 1, 1, 2, 181.0f, 66.0f, 1.22f, 4.0f, 1.00f, 4.00f, 1.00f, TYP),
+(180, 74, 1.57f, 1, 1, 1, 2, 182.0f, 74.0f, 1.22f, 5.0f, 1.00f, 5.00f, 1.00f, TYP),
+(192, 4 , 1.57f, 1, 1, 1, 2, 193.0f, 4.00f, 1.05f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(192, 10, 1.57f, 1, 1, 1, 2, 193.0f, 10.0f, 1.05f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(192, 14, 1.57f, 1, 1, 1, 2, 193.0f, 14.0f, 1.05f, 1.0f, 0.50f, 0.50f, 0.50f, TYP),
+(192, 18, 1.57f, 1, 1, 1, 2, 193.0f, 18.0f, 1.05f, 1.0f, 0.50f, 0.30f, 0.30f, TYP),
+(192, 26, 1.57f, 1, 1, 1, 2, 193.0f, 26.0f, 1.05f, 1.0f, 4.00f, 1.00f, 4.00f, TYP),
+(192, 38, 1.57f, 1, 1, 1, 2, 193.0f, 38.0f, 1.05f, 1.0f, 5.00f, 1.00f, 5.00f, TYP),
+(192, 48, 1.57f, 1, 1, 1, 2, 193.0f, 48.0f, 1.05f, 0.5f, 0.50f, 0.50f, 2.00f, TYP),
+(192, 54, 1.57f, 1, 1, 1, 2, 193.0f, 54.0f, 1.05f, 0.2f, 0.50f, 0.20f, 2.00f, TYP),
+(192, 60, 1.57f, 1, 1, 1, 2, 192.0f, 60.0f, 1.05f, 3.0f, 1.00f, 3.00f, 1.00f, TYP),
+(192, 66, 1.57f, 1, 1, 1, 2, 193.0f, 66.0f, 1.05f, 4.0f, 1.00f, 4.00f, 1.00f, TYP),
+(192, 74, 1.57f, 1, 1, 1, 2, 194.0f, 74.0f, 1.05f, 5.0f, 1.00f, 5.00f, 1.00f, TYP),
+(204, 4 , 0.79f, 1, 1, 1, 2, 205.0f, 4.00f, 0.79f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(204, 10, 0.79f, 1, 1, 1, 2, 205.0f, 10.0f, 0.79f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(204, 14, 0.79f, 1, 1, 1, 2, 205.0f, 14.0f, 0.79f, 1.0f, 0.50f, 0.50f, 0.50f, TYP),
+(204, 18, 0.79f, 1, 1, 1, 2, 205.0f, 18.0f, 0.79f, 1.0f, 0.50f, 0.30f, 0.30f, TYP),
+(204, 26, 0.79f, 1, 1, 1, 2, 205.0f, 26.0f, 0.79f, 1.0f, 4.00f, 1.00f, 4.00f, TYP),
+(204, 38, 0.79f, 1, 1, 1, 2, 205.0f, 38.0f, 0.79f, 1.0f, 5.00f, 1.00f, 5.00f, TYP),
+(204, 48, 0.79f, 1, 1, 1, 2, 205.0f, 48.0f, 0.79f, 0.5f, 0.50f, 0.50f, 2.00f, TYP),
+(204, 54, 0.79f, 1, 1, 1, 2, 205.0f, 54.0f, 0.79f, 0.2f, 0.50f, 0.20f, 2.00f, TYP),
+(204, 60, 0.79f, 1, 1, 1, 2, 204.3f, 60.0f, 0.79f, 3.0f, 1.00f, 3.00f, 1.00f, TYP),
+(204, 66, 0.79f, 1, 1, 1, 2, 205.3f, 66.0f, 0.79f, 4.0f, 1.00f, 4.00f, 1.00f, TYP),
+(204, 74, 0.79f, 1, 1, 1, 2, 206.3f, 74.0f, 0.79f, 5.0f, 1.00f, 5.00f, 1.00f, TYP),
+(216, 4 , 0.79f, 1, 1, 1, 2, 217.0f, 4.00f, 0.61f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(216, 10, 0.79f, 1, 1, 1, 2, 217.0f, 10.0f, 0.61f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(216, 14, 0.79f, 1, 1, 1, 2, 217.0f, 14.0f, 0.61f, 1.0f, 0.50f, 0.50f, 0.50f, TYP),
+(216, 18, 0.79f, 1, 1, 1, 2, 217.0f, 18.0f, 0.61f, 1.0f, 0.50f, 0.30f, 0.30f, TYP),
+(216, 26, 0.79f, 1, 1, 1, 2, 217.0f, 26.0f, 0.61f, 1.0f, 4.00f, 1.00f, 4.00f, TYP),
+(216, 38, 0.79f, 1, 1, 1, 2, 217.0f, 38.0f, 0.61f, 1.0f, 5.00f, 1.00f, 5.00f, TYP),
+(216, 48, 0.79f, 1, 1, 1, 2, 217.0f, 48.0f, 0.61f, 0.5f, 0.50f, 0.50f, 2.00f, TYP),
+(216, 54, 0.79f, 1, 1, 1, 2, 217.0f, 54.0f, 0.61f, 0.2f, 0.50f, 0.20f, 2.00f, TYP),
+(216, 60, 0.79f, 1, 1, 1, 2, 216.3f, 60.0f, 0.61f, 3.0f, 1.00f, 3.00f, 1.00f, TYP),
+(216, 66, 0.79f, 1, 1, 1, 2, 217.3f, 66.0f, 0.61f, 4.0f, 1.00f, 4.00f, 1.00f, TYP),
+(216, 74, 0.79f, 1, 1, 1, 2, 218.3f, 74.0f, 0.61f, 5.0f, 1.00f, 5.00f, 1.00f, TYP),
+(228, 4 , 0.79f, 1, 1, 1, 2, 229.0f, 4.00f, 0.44f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(228, 10, 0.79f, 1, 1, 1, 2, 229.0f, 10.0f, 0.44f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(228, 14, 0.79f, 1, 1, 1, 2, 229.0f, 14.0f, 0.44f, 1.0f, 0.50f, 0.50f, 0.50f, TYP),
+(228, 18, 0.79f, 1, 1, 1, 2, 229.0f, 18.0f, 0.44f, 1.0f, 0.50f, 0.30f, 0.30f, TYP),
+(228, 26, 0.79f, 1, 1, 1, 2, 229.0f, 26.0f, 0.44f, 1.0f, 4.00f, 1.00f, 4.00f, TYP),
+(228, 38, 0.79f, 1, 1, 1, 2, 229.0f, 38.0f, 0.44f, 1.0f, 5.00f, 1.00f, 5.00f, TYP),
+(228, 48, 0.79f, 1, 1, 1, 2, 229.0f, 48.0f, 0.44f, 0.5f, 0.50f, 0.50f, 2.00f, TYP),
+(228, 54, 0.79f, 1, 1, 1, 2, 226.3f, 54.0f, 0.44f, 0.2f, 0.50f, 0.20f, 2.00f, TYP),
+(228, 60, 0.79f, 1, 1, 1, 2, 228.3f, 60.0f, 0.44f, 3.0f, 1.00f, 3.00f, 1.00f, TYP),
+(228, 66, 0.79f, 1, 1, 1, 2, 229.3f, 66.0f, 0.44f, 4.0f, 1.00f, 4.00f, 1.00f, TYP),
+(228, 74, 0.79f, 1, 1, 1, 2, 230.3f, 74.0f, 0.44f, 5.0f, 1.00f, 5.00f, 1.00f, TYP),
+(240, 4 , 0.79f, 1, 1, 1, 2, 241.0f, 4.00f, 0.26f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(240, 10, 0.79f, 1, 1, 1, 2, 241.0f, 10.0f, 0.26f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(240, 14, 0.79f, 1, 1, 1, 2, 241.0f, 14.0f, 0.26f, 1.0f, 0.50f, 0.50f, 0.50f, TYP),
+(240, 18, 0.79f, 1, 1, 1, 2, 241.0f, 18.0f, 0.26f, 1.0f, 0.50f, 0.30f, 0.30f, TYP),
+(240, 26, 0.79f, 1, 1, 1, 2, 241.0f, 26.0f, 0.26f, 1.0f, 4.00f, 1.00f, 4.00f, TYP),
+(240, 38, 0.79f, 1, 1, 1, 2, 241.0f, 38.0f, 0.26f, 1.0f, 5.00f, 1.00f, 5.00f, TYP),
+(240, 48, 0.79f, 1, 1, 1, 2, 241.0f, 48.0f, 0.26f, 0.5f, 0.50f, 0.50f, 2.00f, TYP),
+(240, 54, 0.79f, 1, 1, 1, 2, 240.0f, 54.0f, 0.26f, 0.2f, 0.50f, 0.20f, 2.00f, TYP),
+(240, 60, 0.79f, 1, 1, 1, 2, 240.3f, 60.0f, 0.26f, 3.0f, 1.00f, 3.00f, 1.00f, TYP),
+(240, 66, 0.79f, 1, 1, 1, 2, 241.3f, 66.0f, 0.26f, 4.0f, 1.00f, 4.00f, 1.00f, TYP),
+(240, 74, 0.79f, 1, 1, 1, 2, 242.3f, 74.0f, 0.26f, 5.0f, 1.00f, 5.00f, 1.00f, TYP),
+(252, 4 , 0.00f, 1, 1, 1, 2, 253.0f, 4.00f, 0.17f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(252, 10, 0.00f, 1, 1, 1, 2, 253.0f, 10.0f, 0.17f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(252, 14, 0.00f, 1, 1, 1, 2, 253.0f, 14.0f, 0.17f, 1.0f, 0.50f, 0.50f, 0.50f, TYP),
+(252, 18, 0.00f, 1, 1, 1, 2, 253.0f, 18.0f, 0.17f, 1.0f, 0.50f, 0.30f, 0.30f, TYP),
+(252, 26, 0.00f, 1, 1, 1, 2, 253.0f, 26.0f, 0.17f, 1.0f, 4.00f, 1.00f, 4.00f, TYP),
+(252, 38, 0.00f, 1, 1, 1, 2, 253.0f, 38.0f, 0.17f, 1.0f, 5.00f, 1.00f, 5.00f, TYP),
+(252, 48, 0.00f, 1, 1, 1, 2, 253.0f, 48.0f, 0.17f, 0.5f, 0.50f, 0.50f, 2.00f, TYP),
+(252, 54, 0.00f, 1, 1, 1, 2, 253.0f, 54.0f, 0.17f, 0.2f, 0.50f, 0.20f, 2.00f, TYP),
+(252, 60, 0.00f, 1, 1, 1, 2, 255.0f, 60.0f, 0.17f, 3.0f, 1.00f, 3.00f, 1.00f, TYP),
+(252, 66, 0.00f, 1, 1, 1, 2, 256.0f, 66.0f, 0.17f, 4.0f, 1.00f, 4.00f, 1.00f, TYP),
+(252, 74, 0.00f, 1, 1, 1, 2, 257.0f, 74.0f, 0.17f, 5.0f, 1.00f, 5.00f, 1.00f, TYP),
+(264, 4 , 0.00f, 1, 1, 1, 2, 265.0f, 4.00f, 0.35f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(264, 10, 0.00f, 1, 1, 1, 2, 265.0f, 10.0f, 0.35f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(264, 14, 0.00f, 1, 1, 1, 2, 265.0f, 14.0f, 0.35f, 1.0f, 0.50f, 0.50f, 0.50f, TYP),
+(264, 18, 0.00f, 1, 1, 1, 2, 265.0f, 18.0f, 0.35f, 1.0f, 0.50f, 0.30f, 0.30f, TYP),
+(264, 26, 0.00f, 1, 1, 1, 2, 265.0f, 26.0f, 0.35f, 1.0f, 4.00f, 1.00f, 4.00f, TYP),
+(264, 38, 0.00f, 1, 1, 1, 2, 265.0f, 38.0f, 0.35f, 1.0f, 5.00f, 1.00f, 5.00f, TYP),
+(264, 48, 0.00f, 1, 1, 1, 2, 265.0f, 48.0f, 0.35f, 0.5f, 0.50f, 0.50f, 2.00f, TYP),
+(264, 54, 0.00f, 1, 1, 1, 2, 265.0f, 54.0f, 0.35f, 0.2f, 0.50f, 0.20f, 2.00f, TYP),
+(264, 60, 0.00f, 1, 1, 1, 2, 267.0f, 60.0f, 0.35f, 3.0f, 1.00f, 3.00f, 1.00f, TYP),
+(264, 66, 0.00f, 1, 1, 1, 2, 268.0f, 66.0f, 0.35f, 4.0f, 1.00f, 4.00f, 1.00f, TYP),
+(264, 74, 0.00f, 1, 1, 1, 2, 269.0f, 74.0f, 0.35f, 5.0f, 1.00f, 5.00f, 1.00f, TYP),
+(276, 4 , 0.00f, 1, 1, 1, 2, 277.0f, 4.00f, 0.52f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(276, 10, 0.00f, 1, 1, 1, 2, 277.0f, 10.0f, 0.52f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(276, 14, 0.00f, 1, 1, 1, 2, 277.0f, 14.0f, 0.52f, 1.0f, 0.50f, 0.50f, 0.50f, TYP),
+(276, 18, 0.00f, 1, 1, 1, 2, 277.0f, 18.0f, 0.52f, 1.0f, 0.50f, 0.30f, 0.30f, TYP),
+(276, 26, 0.00f, 1, 1, 1, 2, 277.0f, 26.0f, 0.52f, 1.0f, 4.00f, 1.00f, 4.00f, TYP),
+(276, 38, 0.00f, 1, 1, 1, 2, 277.0f, 38.0f, 0.52f, 1.0f, 5.00f, 1.00f, 5.00f, TYP),
+(276, 48, 0.00f, 1, 1, 1, 2, 277.0f, 48.0f, 0.52f, 0.5f, 0.50f, 0.50f, 2.00f, TYP),
+(276, 54, 0.00f, 1, 1, 1, 2, 277.0f, 54.0f, 0.52f, 0.2f, 0.50f, 0.20f, 2.00f, TYP),
+(276, 60, 0.00f, 1, 1, 1, 2, 279.0f, 60.0f, 0.52f, 3.0f, 1.00f, 3.00f, 1.00f, TYP),
+(276, 66, 0.00f, 1, 1, 1, 2, 280.0f, 66.0f, 0.52f, 4.0f, 1.00f, 4.00f, 1.00f, TYP),
+(276, 74, 0.00f, 1, 1, 1, 2, 281.0f, 74.0f, 0.52f, 5.0f, 1.00f, 5.00f, 1.00f, TYP),
+(288, 4 , 0.79f, 1, 1, 1, 2, 289.0f, 4.00f, 0.79f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(288, 10, 0.79f, 1, 1, 1, 2, 289.0f, 10.0f, 0.79f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(288, 14, 0.79f, 1, 1, 1, 2, 289.0f, 14.0f, 0.79f, 1.0f, 0.50f, 0.50f, 0.50f, TYP),
+(288, 18, 0.79f, 1, 1, 1, 2, 289.0f, 18.0f, 0.79f, 1.0f, 0.50f, 0.30f, 0.30f, TYP),
+(288, 26, 0.79f, 1, 1, 1, 2, 289.0f, 26.0f, 0.79f, 1.0f, 4.00f, 1.00f, 4.00f, TYP),
+(288, 38, 0.79f, 1, 1, 1, 2, 289.0f, 38.0f, 0.79f, 1.0f, 5.00f, 1.00f, 5.00f, TYP),
+(288, 48, 0.79f, 1, 1, 1, 2, 289.0f, 48.0f, 0.79f, 0.5f, 0.50f, 0.50f, 2.00f, TYP),
+(288, 54, 0.79f, 1, 1, 1, 2, 289.0f, 54.0f, 0.79f, 0.2f, 0.50f, 0.20f, 2.00f, TYP),
+(288, 60, 0.79f, 1, 1, 1, 2, 291.0f, 60.0f, 0.79f, 3.0f, 1.00f, 3.00f, 1.00f, TYP),
+(288, 66, 0.79f, 1, 1, 1, 2, 290.5f, 66.0f, 0.79f, 4.0f, 1.00f, 4.00f, 1.00f, TYP),
+(288, 74, 0.79f, 1, 1, 1, 2, 291.5f, 74.0f, 0.79f, 5.0f, 1.00f, 5.00f, 1.00f, TYP),
+(300, 4 , 0.79f, 1, 1, 1, 2, 301.0f, 4.00f, 0.96f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(300, 10, 0.79f, 1, 1, 1, 2, 301.0f, 10.0f, 0.96f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(300, 14, 0.79f, 1, 1, 1, 2, 301.0f, 14.0f, 0.96f, 1.0f, 0.50f, 0.50f, 0.50f, TYP),
+(300, 18, 0.79f, 1, 1, 1, 2, 301.0f, 18.0f, 0.96f, 1.0f, 0.50f, 0.30f, 0.30f, TYP),
+(300, 26, 0.79f, 1, 1, 1, 2, 301.0f, 26.0f, 0.96f, 1.0f, 4.00f, 1.00f, 4.00f, TYP),
+(300, 38, 0.79f, 1, 1, 1, 2, 301.0f, 38.0f, 0.96f, 1.0f, 5.00f, 1.00f, 5.00f, TYP),
+(300, 48, 0.79f, 1, 1, 1, 2, 301.0f, 48.0f, 0.96f, 0.5f, 0.50f, 0.50f, 2.00f, TYP),
+(300, 54, 0.79f, 1, 1, 1, 2, 301.0f, 54.0f, 0.96f, 0.2f, 0.50f, 0.20f, 2.00f, TYP),
+(300, 60, 0.79f, 1, 1, 1, 2, 303.0f, 60.0f, 0.96f, 3.0f, 1.00f, 3.00f, 1.00f, TYP),
+(300, 66, 0.79f, 1, 1, 1, 2, 301.3f, 66.0f, 0.96f, 4.0f, 1.00f, 4.00f, 1.00f, TYP),
+(300, 74, 0.79f, 1, 1, 1, 2, 302.3f, 74.0f, 0.96f, 5.0f, 1.00f, 5.00f, 1.00f, TYP),
+(312, 4 , 0.79f, 1, 1, 1, 2, 313.0f, 4.00f, 1.13f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(312, 10, 0.79f, 1, 1, 1, 2, 313.0f, 10.0f, 1.13f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(312, 14, 0.79f, 1, 1, 1, 2, 313.0f, 14.0f, 1.13f, 1.0f, 0.50f, 0.50f, 0.50f, TYP),
+(312, 18, 0.79f, 1, 1, 1, 2, 313.0f, 18.0f, 1.13f, 1.0f, 0.50f, 0.30f, 0.30f, TYP),
+(312, 26, 0.79f, 1, 1, 1, 2, 313.0f, 26.0f, 1.13f, 1.0f, 4.00f, 1.00f, 4.00f, TYP),
+(312, 38, 0.79f, 1, 1, 1, 2, 313.0f, 38.0f, 1.13f, 1.0f, 5.00f, 1.00f, 5.00f, TYP),
+(312, 48, 0.79f, 1, 1, 1, 2, 313.0f, 48.0f, 1.13f, 0.5f, 0.50f, 0.50f, 2.00f, TYP),
+(312, 54, 0.79f, 1, 1, 1, 2, 313.0f, 54.0f, 1.13f, 0.2f, 0.50f, 0.20f, 2.00f, TYP),
+(312, 60, 0.79f, 1, 1, 1, 2, 315.0f, 60.0f, 1.13f, 3.0f, 1.00f, 3.00f, 1.00f, TYP),
+(312, 66, 0.79f, 1, 1, 1, 2, 313.3f, 66.0f, 1.13f, 4.0f, 1.00f, 4.00f, 1.00f, TYP),
+(312, 74, 0.79f, 1, 1, 1, 2, 314.3f, 74.0f, 1.13f, 5.0f, 1.00f, 5.00f, 1.00f, TYP),
+(324, 4 , 0.79f, 1, 1, 1, 2, 325.0f, 4.00f, 1.31f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(324, 10, 0.79f, 1, 1, 1, 2, 325.0f, 10.0f, 1.31f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(324, 14, 0.79f, 1, 1, 1, 2, 325.0f, 14.0f, 1.31f, 1.0f, 0.50f, 0.50f, 0.50f, TYP),
+(324, 18, 0.79f, 1, 1, 1, 2, 325.0f, 18.0f, 1.31f, 1.0f, 0.50f, 0.30f, 0.30f, TYP),
+(324, 26, 0.79f, 1, 1, 1, 2, 325.0f, 26.0f, 1.31f, 1.0f, 4.00f, 1.00f, 4.00f, TYP),
+(324, 38, 0.79f, 1, 1, 1, 2, 325.0f, 38.0f, 1.31f, 1.0f, 5.00f, 1.00f, 5.00f, TYP),
+(324, 48, 0.79f, 1, 1, 1, 2, 325.0f, 48.0f, 1.31f, 0.5f, 0.50f, 0.50f, 2.00f, TYP),
+(324, 54, 0.79f, 1, 1, 1, 2, 325.0f, 54.0f, 1.31f, 0.2f, 0.50f, 0.20f, 2.00f, TYP),
+(324, 60, 0.79f, 1, 1, 1, 2, 327.0f, 60.0f, 1.31f, 3.0f, 1.00f, 3.00f, 1.00f, TYP),
+(324, 66, 0.79f, 1, 1, 1, 2, 325.3f, 66.0f, 1.31f, 4.0f, 1.00f, 4.00f, 1.00f, TYP),
+(324, 74, 0.79f, 1, 1, 1, 2, 326.3f, 74.0f, 1.31f, 5.0f, 1.00f, 5.00f, 1.00f, TYP),
+(336, 4 , 1.57f, 1, 1, 1, 2, 337.0f, 3.50f, 1.57f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(336, 10, 1.57f, 1, 1, 1, 2, 337.0f, 9.50f, 1.57f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(336, 14, 1.57f, 1, 1, 1, 2, 337.0f, 13.5f, 1.57f, 1.0f, 0.50f, 0.50f, 0.50f, TYP),
+(336, 18, 1.57f, 1, 1, 1, 2, 337.0f, 17.5f, 1.57f, 1.0f, 0.50f, 0.30f, 0.30f, TYP),
+(336, 26, 1.57f, 1, 1, 1, 2, 337.0f, 25.5f, 1.57f, 1.0f, 4.00f, 1.00f, 4.00f, TYP),
+(336, 38, 1.57f, 1, 1, 1, 2, 337.0f, 37.5f, 1.57f, 1.0f, 5.00f, 1.00f, 5.00f, TYP),
+(336, 48, 1.57f, 1, 1, 1, 2, 337.0f, 48.0f, 1.57f, 0.5f, 0.50f, 0.50f, 2.00f, TYP),
+(336, 54, 1.57f, 1, 1, 1, 2, 337.0f, 54.0f, 1.57f, 0.2f, 0.50f, 0.20f, 2.00f, TYP),
+(336, 60, 1.57f, 1, 1, 1, 2, 338.3f, 60.0f, 1.57f, 3.0f, 1.00f, 3.00f, 1.00f, TYP),
+(336, 66, 1.57f, 1, 1, 1, 2, 337.3f, 66.0f, 1.57f, 4.0f, 1.00f, 4.00f, 1.00f, TYP),
+(336, 74, 1.57f, 1, 1, 1, 2, 338.3f, 74.0f, 1.57f, 5.0f, 1.00f, 5.00f, 1.00f, TYP),
+(348, 4 , 1.57f, 1, 1, 1, 2, 349.0f, 4.00f, 1.75f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(348, 10, 1.57f, 1, 1, 1, 2, 349.0f, 10.0f, 1.75f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(348, 14, 1.57f, 1, 1, 1, 2, 349.0f, 14.0f, 1.75f, 1.0f, 0.50f, 0.50f, 0.50f, TYP),
+(348, 18, 1.57f, 1, 1, 1, 2, 349.0f, 18.0f, 1.75f, 1.0f, 0.50f, 0.30f, 0.30f, TYP),
+(348, 26, 1.57f, 1, 1, 1, 2, 349.0f, 26.0f, 1.75f, 1.0f, 4.00f, 1.00f, 4.00f, TYP),
+(348, 38, 1.57f, 1, 1, 1, 2, 349.0f, 38.0f, 1.75f, 1.0f, 5.00f, 1.00f, 5.00f, TYP),
+(348, 48, 1.57f, 1, 1, 1, 2, 349.0f, 48.0f, 1.75f, 0.5f, 0.50f, 0.50f, 2.00f, TYP),
+(348, 54, 1.57f, 1, 1, 1, 2, 349.0f, 54.0f, 1.75f, 0.2f, 0.50f, 0.20f, 2.00f, TYP),
+(348, 60, 1.57f, 1, 1, 1, 2, 351.0f, 60.0f, 1.75f, 3.0f, 1.00f, 3.00f, 1.00f, TYP),
+(348, 66, 1.57f, 1, 1, 1, 2, 349.3f, 66.0f, 1.75f, 4.0f, 1.00f, 4.00f, 1.00f, TYP),
+(348, 74, 1.57f, 1, 1, 1, 2, 350.3f, 74.0f, 1.75f, 5.0f, 1.00f, 5.00f, 1.00f, TYP),
+(360, 4 , 1.57f, 1, 1, 1, 2, 361.0f, 4.00f, 1.92f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(360, 10, 1.57f, 1, 1, 1, 2, 361.0f, 10.0f, 1.92f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(360, 14, 1.57f, 1, 1, 1, 2, 361.0f, 14.0f, 1.92f, 1.0f, 0.50f, 0.50f, 0.50f, TYP),
+(360, 18, 1.57f, 1, 1, 1, 2, 361.0f, 18.0f, 1.92f, 1.0f, 0.50f, 0.30f, 0.30f, TYP),
+(360, 26, 1.57f, 1, 1, 1, 2, 361.0f, 26.0f, 1.92f, 1.0f, 4.00f, 1.00f, 4.00f, TYP),
+(360, 38, 1.57f, 1, 1, 1, 2, 361.0f, 38.0f, 1.92f, 1.0f, 5.00f, 1.00f, 5.00f, TYP),
+(360, 48, 1.57f, 1, 1, 1, 2, 361.0f, 48.0f, 1.92f, 0.5f, 0.50f, 0.50f, 2.00f, TYP),
+(360, 54, 1.57f, 1, 1, 1, 2, 361.0f, 54.0f, 1.92f, 0.2f, 0.50f, 0.20f, 2.00f, TYP),
+(360, 60, 1.57f, 1, 1, 1, 2, 363.0f, 60.0f, 1.92f, 3.0f, 1.00f, 3.00f, 1.00f, TYP),
+(360, 66, 1.57f, 1, 1, 1, 2, 361.3f, 66.0f, 1.92f, 4.0f, 1.00f, 4.00f, 1.00f, TYP),
+(360, 74, 1.57f, 1, 1, 1, 2, 362.3f, 74.0f, 1.92f, 5.0f, 1.00f, 5.00f, 1.00f, TYP),
+(372, 4 , 1.57f, 1, 1, 1, 2, 373.0f, 4.00f, 2.09f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(372, 10, 1.57f, 1, 1, 1, 2, 373.0f, 10.0f, 2.09f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(372, 14, 1.57f, 1, 1, 1, 2, 373.0f, 14.0f, 2.09f, 1.0f, 0.50f, 0.50f, 0.50f, TYP),
+(372, 18, 1.57f, 1, 1, 1, 2, 373.0f, 18.0f, 2.09f, 1.0f, 0.50f, 0.30f, 0.30f, TYP),
+(372, 26, 1.57f, 1, 1, 1, 2, 373.0f, 26.0f, 2.09f, 1.0f, 4.00f, 1.00f, 4.00f, TYP),
+(372, 38, 1.57f, 1, 1, 1, 2, 373.0f, 38.0f, 2.09f, 1.0f, 5.00f, 1.00f, 5.00f, TYP),
+(372, 48, 1.57f, 1, 1, 1, 2, 373.0f, 48.0f, 2.09f, 0.5f, 0.50f, 0.50f, 2.00f, TYP),
+(372, 54, 1.57f, 1, 1, 1, 2, 373.0f, 54.0f, 2.09f, 0.2f, 0.50f, 0.20f, 2.00f, TYP),
+(372, 60, 1.57f, 1, 1, 1, 2, 375.0f, 60.0f, 2.09f, 3.0f, 1.00f, 3.00f, 1.00f, TYP),
+(372, 66, 1.57f, 1, 1, 1, 2, 373.3f, 66.0f, 2.09f, 4.0f, 1.00f, 4.00f, 1.00f, TYP),
+(372, 74, 1.57f, 1, 1, 1, 2, 374.3f, 74.0f, 2.09f, 5.0f, 1.00f, 5.00f, 1.00f, TYP),
+(384, 4 , 2.36f, 1, 1, 1, 2, 385.0f, 4.00f, 2.36f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(384, 10, 2.36f, 1, 1, 1, 2, 385.0f, 10.0f, 2.36f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(384, 14, 2.36f, 1, 1, 1, 2, 385.0f, 14.0f, 2.36f, 1.0f, 0.50f, 0.50f, 0.50f, TYP),
+(384, 18, 2.36f, 1, 1, 1, 2, 385.0f, 18.0f, 2.36f, 1.0f, 0.50f, 0.30f, 0.30f, TYP),
+(384, 26, 2.36f, 1, 1, 1, 2, 385.0f, 26.0f, 2.36f, 1.0f, 4.00f, 1.00f, 4.00f, TYP),
+(384, 38, 2.36f, 1, 1, 1, 2, 385.0f, 38.0f, 2.36f, 1.0f, 5.00f, 1.00f, 5.00f, TYP),
+(384, 48, 2.36f, 1, 1, 1, 2, 385.0f, 48.0f, 2.36f, 0.5f, 0.50f, 0.50f, 2.00f, TYP),
+(384, 54, 2.36f, 1, 1, 1, 2, 385.0f, 54.0f, 2.36f, 0.2f, 0.50f, 0.20f, 2.00f, TYP),
+(384, 60, 2.36f, 1, 1, 1, 2, 387.0f, 60.0f, 2.36f, 3.0f, 1.00f, 3.00f, 1.00f, TYP),
+(384, 66, 2.36f, 1, 1, 1, 2, 386.0f, 66.0f, 2.36f, 4.0f, 1.00f, 4.00f, 1.00f, TYP),
+(384, 74, 2.36f, 1, 1, 1, 2, 387.0f, 74.0f, 2.36f, 5.0f, 1.00f, 5.00f, 1.00f, TYP),
+(396, 4 , 2.36f, 1, 1, 1, 2, 397.0f, 4.00f, 2.53f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(396, 10, 2.36f, 1, 1, 1, 2, 397.0f, 10.0f, 2.53f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(396, 14, 2.36f, 1, 1, 1, 2, 397.0f, 14.0f, 2.53f, 1.0f, 0.50f, 0.50f, 0.50f, TYP),
+(396, 18, 2.36f, 1, 1, 1, 2, 397.0f, 18.0f, 2.53f, 1.0f, 0.50f, 0.30f, 0.30f, TYP),
+(396, 26, 2.36f, 1, 1, 1, 2, 397.0f, 26.0f, 2.53f, 1.0f, 4.00f, 1.00f, 4.00f, TYP),
+(396, 38, 2.36f, 1, 1, 1, 2, 397.0f, 38.0f, 2.53f, 1.0f, 5.00f, 1.00f, 5.00f, TYP),
+(396, 48, 2.36f, 1, 1, 1, 2, 397.0f, 48.0f, 2.53f, 0.5f, 0.50f, 0.50f, 2.00f, TYP),
+(396, 54, 2.36f, 1, 1, 1, 2, 397.0f, 54.0f, 2.53f, 0.2f, 0.50f, 0.20f, 2.00f, TYP),
+(396, 60, 2.36f, 1, 1, 1, 2, 399.0f, 60.0f, 2.53f, 3.0f, 1.00f, 3.00f, 1.00f, TYP),
+(396, 66, 2.36f, 1, 1, 1, 2, 400.0f, 66.0f, 2.53f, 4.0f, 1.00f, 4.00f, 1.00f, TYP),
+(396, 74, 2.36f, 1, 1, 1, 2, 401.0f, 74.0f, 2.53f, 5.0f, 1.00f, 5.00f, 1.00f, TYP),
+(408, 4 , 2.36f, 1, 1, 1, 2, 409.0f, 4.00f, 2.71f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(408, 10, 2.36f, 1, 1, 1, 2, 409.0f, 10.0f, 2.71f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(408, 14, 2.36f, 1, 1, 1, 2, 409.0f, 14.0f, 2.71f, 1.0f, 0.50f, 0.50f, 0.50f, TYP),
+(408, 18, 2.36f, 1, 1, 1, 2, 409.0f, 18.0f, 2.71f, 1.0f, 0.50f, 0.30f, 0.30f, TYP),
+(408, 26, 2.36f, 1, 1, 1, 2, 409.0f, 26.0f, 2.71f, 1.0f, 4.00f, 1.00f, 4.00f, TYP),
+(408, 38, 2.36f, 1, 1, 1, 2, 409.0f, 38.0f, 2.71f, 1.0f, 5.00f, 1.00f, 5.00f, TYP),
+(408, 48, 2.36f, 1, 1, 1, 2, 409.0f, 48.0f, 2.71f, 0.5f, 0.50f, 0.50f, 2.00f, TYP),
+(408, 54, 2.36f, 1, 1, 1, 2, 409.0f, 54.0f, 2.71f, 0.2f, 0.50f, 0.20f, 2.00f, TYP),
+(408, 60, 2.36f, 1, 1, 1, 2, 411.0f, 60.0f, 2.71f, 3.0f, 1.00f, 3.00f, 1.00f, TYP),
+(408, 66, 2.36f, 1, 1, 1, 2, 412.0f, 66.0f, 2.71f, 4.0f, 1.00f, 4.00f, 1.00f, TYP),
+(408, 74, 2.36f, 1, 1, 1, 2, 413.0f, 74.0f, 2.71f, 5.0f, 1.00f, 5.00f, 1.00f, TYP),
+(420, 4 , 2.36f, 1, 1, 1, 2, 421.0f, 4.00f, 2.88f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(420, 10, 2.36f, 1, 1, 1, 2, 421.0f, 10.0f, 2.88f, 1.0f, 0.50f, 1.00f, 2.00f, TYP),
+(420, 14, 2.36f, 1, 1, 1, 2, 421.0f, 14.0f, 2.88f, 1.0f, 0.50f, 0.50f, 0.50f, TYP),
+(420, 18, 2.36f, 1, 1, 1, 2, 421.0f, 18.0f, 2.88f, 1.0f, 0.50f, 0.30f, 0.30f, TYP),
+(420, 26, 2.36f, 1, 1, 1, 2, 421.0f, 26.0f, 2.88f, 1.0f, 4.00f, 1.00f, 4.00f, TYP),
+(420, 38, 2.36f, 1, 1, 1, 2, 421.0f, 38.0f, 2.88f, 1.0f, 5.00f, 1.00f, 5.00f, TYP),
+(420, 48, 2.36f, 1, 1, 1, 2, 421.0f, 48.0f, 2.88f, 0.5f, 0.50f, 0.50f, 2.00f, TYP),
+(420, 54, 2.36f, 1, 1, 1, 2, 421.0f, 54.0f, 2.88f, 0.2f, 0.50f, 0.20f, 2.00f, TYP),
+(420, 60, 2.36f, 1, 1, 1, 2, 423.0f, 60.0f, 2.88f, 3.0f, 1.00f, 3.00f, 1.00f, TYP),
+(420, 66, 2.36f, 1, 1, 1, 2, 424.0f, 66.0f, 2.88f, 4.0f, 1.00f, 4.00f, 1.00f, TYP),
+(420, 74, 2.36f, 1, 1, 1, 2, 425.0f, 74.0f, 2.88f, 5.0f, 1.00f, 5.00f, 1.00f, TYP))
+'''
+
+# Case type code of the TYP entries, the only type in the table so far
+TYP = 0
+
+# Column names and storage types of the table; the coordinates of rect1 and its fixed
+# size are whole numbers, everything else is single precision as in the C table
+TABLE_FIELDS = [
+    ('cx1', np.int16), ('cy1', np.int16), ('o1', np.float32),
+    ('lf1', np.int8), ('wl1', np.int8), ('lr1', np.int8), ('wr1', np.int8),
+    ('cx2', np.float32), ('cy2', np.float32), ('o2', np.float32),
+    ('lf2', np.float32), ('wl2', np.float32), ('lr2', np.float32), ('wr2', np.float32),
+    ('typ', np.int8),
+]
+
+def parse_c_table(text):
+    """Parses the C initializer into a dict of columns, one contiguous array per field."""
+    # Every innermost (...) is a row; drop the float suffixes and resolve TYP
+    rows = [row.replace('f', '').replace('TYP', str(TYP)).split(',')
+            for row in re.findall(r'\(([^()]*)\)', text)]
+    values = np.array(rows, dtype=float)
+    return {name: values[:, j].astype(dtype) for j, (name, dtype) in enumerate(TABLE_FIELDS)}
+
+# The sizes of rect2 all come from this small set, so those columns are stored as
+# uint8 indices into it
+PALETTE = np.array([0.2, 0.3, 0.5, 1.0, 2.0, 3.0, 4.0, 5.0], dtype=np.float32)
+PALETTE_FIELDS = ['lf2', 'wl2', 'lr2', 'wr2']
+
+def encode_palette(table):
+    """Replaces the PALETTE_FIELDS columns by their uint8 indices into PALETTE."""
+    for name in PALETTE_FIELDS:
+        if not np.isin(table[name], PALETTE).all():
+            raise ValueError(f"column {name} has values outside PALETTE")
+        table[name] = np.searchsorted(PALETTE, table[name]).astype(np.uint8)
+    return table
+
+# rect1 is only ever rotated by a multiple of 45 degrees, so o1 is stored as the
+# uint8 code k of k * pi / 4; the table's two-decimal values map to exact angles
+ANGLE_LUT = (np.arange(5) * (np.pi / 4)).astype(np.float32)
+
+def encode_angles(table):
+    """Replaces the o1 column by its uint8 code into ANGLE_LUT."""
+    code = np.rint(table['o1'] / (np.pi / 4)).astype(np.uint8)
+    if np.abs(ANGLE_LUT[np.minimum(code, len(ANGLE_LUT) - 1)] - table['o1']).max() > 0.01:
+        raise ValueError("column o1 has angles that are not a multiple of 45 degrees")
+    table['o1'] = code
+    return table
+
+# rect1 has the same size in every case so far, so its four size columns are
+# replaced by that size plus the rows that differ from it
+RECT1_SIZE_FIELDS = ['lf1', 'wl1', 'lr1', 'wr1']
+
+def split_rect1_size(table):
+    """Removes the rect1 size columns, returns the common size and the (rows, sizes) differing from it."""
+    sizes = np.stack([table.pop(name) for name in RECT1_SIZE_FIELDS], axis=1)
+    unique, counts = np.unique(sizes, axis=0, return_counts=True)
+    size = unique[counts.argmax()]
+    rows = np.flatnonzero((sizes != size).any(axis=1))
+    return size, rows, sizes[rows]
+
+if __name__ == "__main__":
+    # Writes the columns, deflate-compressed, next to this script; overlapcheck.py
+    # loads them at import
+    table = encode_angles(encode_palette(parse_c_table(C_TABLE)))
+    rect1_size, override_rows, override_sizes = split_rect1_size(table)
+    np.savez_compressed(os.path.join(os.path.dirname(os.path.abspath(__file__)), "overlap_table.npz"),
+                        palette=PALETTE, angle_lut=ANGLE_LUT, rect1_size=rect1_size,
+                        rect1_override_rows=override_rows, rect1_override_sizes=override_sizes, **table)
@@ -1,94 +1,324 @@
+import functools
+import os
+import shutil
+import warnings
+from types import SimpleNamespace
 import numpy as np
-import pandas as pd
-import json
-from sklearn.model_selection import train_test_split, GridSearchCV
+import pyarrow.feather as feather
+import orjson
+# Importing enable_halving_search_cv makes HalvingGridSearchCV available
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+from sklearn.model_selection import train_test_split, HalvingGridSearchCV, KFold, ParameterGrid, check_cv
+from sklearn.base import BaseEstimator, RegressorMixin
 from sklearn.neural_network import MLPRegressor
-from sklearn.gaussian_process import GaussianProcessRegressor
-from sklearn.gaussian_process.kernels import RBF
-from sklearn.linear_model import SGDRegressor
+from sklearn.kernel_approximation import Nystroem
+from sklearn.pipeline import make_pipeline
+from sklearn.linear_model import SGDRegressor, Ridge
 from sklearn.svm import SVR
+from sklearn.metrics.pairwise import rbf_kernel
 from sklearn.ensemble import GradientBoostingRegressor
 from xgboost import XGBRegressor
 from lightgbm import LGBMRegressor
+from joblib import Memory, Parallel, delayed, parallel_config
+try:
+    import torch
+    from torch import nn
+except ImportError:
+    torch = None
 
-def read_data(filename):
-    df = pd.read_feather(filename)
-    X = df.iloc[:, :-1].values
-    y = df.iloc[:, -1].values
+# The MLP moves to PyTorch only when it is installed and sees a CUDA device
+USE_TORCH = torch is not None and torch.cuda.is_available()
+
+# Parsed datasets are cached on disk next to this script and memory-mapped back on
+# later runs, whatever the working directory
+memory = Memory(os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache'), mmap_mode='r', verbose=0)
+
+@memory.cache
+def load_feather(filename, mtime):
+    # mtime is only part of the cache key, so an updated file is parsed again.
+    # The Arrow file is memory-mapped and its buffers are released as the frame is built.
+    table = feather.read_table(filename, memory_map=True)
+    df = table.to_pandas(self_destruct=True)
+    del table
+    # Single precision halves the memory traffic of every fit; the tree boosters
+    # and the MLP work in float32 natively
+    X = df.iloc[:, :-1].to_numpy(dtype=np.float32)
+    y = df.iloc[:, -1].to_numpy(dtype=np.float32)
     return X, y
 
-def deep_feedforward_nn(X, y):
+def read_data(filename):
+    # Keyed on the absolute path, so the same relative name in another directory
+    # is a different entry
+    filename = os.path.abspath(filename)
+    return load_feather(filename, os.path.getmtime(filename))
+
+# torch.nn layer names of the MLPRegressor activations
+ACTIVATIONS = {
+    'relu': 'ReLU',
+    'tanh': 'Tanh',
+    'logistic': 'Sigmoid'
+}
+
+def seeded_linear(n_in, n_out, generator):
+    # nn.Linear's default initialization, U(-1/sqrt(n_in), 1/sqrt(n_in)) for weights
+    # and biases, drawn from generator instead of the global RNG
+    layer = nn.utils.skip_init(nn.Linear, n_in, n_out)
+    bound = 1.0 / np.sqrt(n_in)
+    with torch.no_grad():
+        layer.weight.uniform_(-bound, bound, generator=generator)
+        layer.bias.uniform_(-bound, bound, generator=generator)
+    return layer
+
+class TorchMLPRegressor(RegressorMixin, BaseEstimator):
+    """MLPRegressor trained with PyTorch: Adam on shuffled mini-batches, the same L2
+    penalty and stopping rule, on the GPU when one is available."""
+
+    def __init__(self, hidden_layer_sizes=(100,), activation='relu', alpha=0.0001, batch_size=200,
+                 learning_rate_init=0.001, max_iter=200, tol=1e-4, n_iter_no_change=10, random_state=0):
+        self.hidden_layer_sizes = hidden_layer_sizes
+        self.activation = activation
+        self.alpha = alpha
+        self.batch_size = batch_size
+        self.learning_rate_init = learning_rate_init
+        self.max_iter = max_iter
+        self.tol = tol
+        self.n_iter_no_change = n_iter_no_change
+        self.random_state = random_state
+
+    def fit(self, X, y):
+        device = 'cuda' if torch.cuda.is_available() else 'cpu'
+        # Local generators for the initial weights and the batch shuffles, so fitting
+        # does not reseed torch's global RNG
+        init_generator = torch.Generator().manual_seed(self.random_state)
+        shuffle_generator = torch.Generator(device=device).manual_seed(self.random_state)
+        X = torch.as_tensor(np.asarray(X, dtype=np.float32), device=device)
+        y = torch.as_tensor(np.asarray(y, dtype=np.float32), device=device).reshape(-1, 1)
+
+        layers = []
+        n_in = X.shape[1]
+        for n_out in self.hidden_layer_sizes:
+            layers += [seeded_linear(n_in, n_out, init_generator),
+                       getattr(nn, ACTIVATIONS[self.activation])()]
+            n_in = n_out
+        layers.append(seeded_linear(n_in, 1, init_generator))
+        self.model_ = nn.Sequential(*layers).to(device)
+        weights = [layer.weight for layer in self.model_ if isinstance(layer, nn.Linear)]
+        optimizer = torch.optim.Adam(self.model_.parameters(), lr=self.learning_rate_init)
+
+        # Squared loss and L2 penalty scaled as MLPRegressor does; stop once the epoch
+        # loss has not improved by tol for n_iter_no_change epochs. The loss is summed
+        # on the device and read back once per epoch, as every .item() is a sync
+        best_loss = np.inf
+        no_change = 0
+        for epoch in range(1, self.max_iter + 1):
+            epoch_loss = torch.zeros((), device=device)
+            order = torch.randperm(len(X), generator=shuffle_generator, device=device)
+            for batch in order.split(self.batch_size):
+                optimizer.zero_grad()
+                loss = 0.5 * nn.functional.mse_loss(self.model_(X[batch]), y[batch])
+                loss = loss + 0.5 * self.alpha * sum((w * w).sum() for w in weights) / len(batch)
+                loss.backward()
+                optimizer.step()
+                epoch_loss += loss.detach() * len(batch)
+            epoch_loss = epoch_loss.item() / len(X)
+            if epoch_loss > best_loss - self.tol:
+                no_change += 1
+            else:
+                no_change = 0
+            best_loss = min(best_loss, epoch_loss)
+            if no_change > self.n_iter_no_change:
+                break
+        self.n_iter_ = epoch
+        return self
+
+    def predict(self, X):
+        device = next(self.model_.parameters()).device
+        with torch.no_grad():
+            X = torch.as_tensor(np.asarray(X, dtype=np.float32), device=device)
+            return self.model_(X).cpu().numpy().ravel()
+
+def deep_feedforward_nn(X, y, cv=5, n_jobs=-1):
     param_grid = {
         'hidden_layer_sizes': [(50,), (100,), (50, 50)],
         'activation': ['relu', 'tanh', 'logistic'],
         'alpha': [0.0001, 0.001, 0.01]
     }
-    model = GridSearchCV(MLPRegressor(max_iter=1000), param_grid, cv=5)
+    # On a GPU the torch model trains far faster; on the CPU its per-batch overhead
+    # makes it slower than scikit-learn's for networks this small. The GPU fits run
+    # one at a time, as parallel workers would each open a CUDA context on one card
+    mlp = TorchMLPRegressor() if USE_TORCH else MLPRegressor(random_state=0)
+    # Successive halving over training epochs: early rounds fit every candidate for
+    # a few iterations, only the best third goes on, up to the full 1000
+    model = HalvingGridSearchCV(mlp, param_grid, cv=cv, factor=3, random_state=0, resource='max_iter',
+                                max_resources=1000, n_jobs=1 if USE_TORCH else n_jobs)
     model.fit(X, y)
     return model
 
-def gaussian_process_regression(X, y):
-    kernel = 1.0 * RBF(length_scale=1.0)
+def gaussian_process_regression(X, y, cv=5, n_jobs=-1):
+    # An exact GP costs O(n^3) time and O(n^2) memory per fit, so the RBF kernel
+    # (length scale 1, i.e. gamma 0.5) is approximated by 500 Nystroem components
+    # and the GP posterior mean by kernel ridge regression on them
     param_grid = {
-        'kernel': [kernel],
-        'alpha': [1e-10, 1e-8, 1e-6]
+        'ridge__alpha': [1e-6, 1e-4, 1e-2]
     }
-    model = GridSearchCV(GaussianProcessRegressor(), param_grid, cv=5)
+    pipeline = make_pipeline(Nystroem(kernel='rbf', gamma=0.5, n_components=500, random_state=0), Ridge())
+    model = HalvingGridSearchCV(pipeline, param_grid, cv=cv, factor=3, random_state=0, n_jobs=n_jobs)
     model.fit(X, y)
     return model
 
-def stochastic_gradient_descent(X, y):
+def sgd_pass(model, X, y, rows, batch_size=1024):
+    # One epoch of partial_fit over shuffled mini-batches of rows, so only a batch
+    # of the (possibly memory-mapped) data is materialized at a time
+    rows = np.random.default_rng(0).permutation(rows)
+    for start in range(0, len(rows), batch_size):
+        batch = rows[start:start + batch_size]
+        model.partial_fit(X[batch], y[batch])
+    return model
+
+def sgd_fold_score(params, X, y, train, test):
+    model = sgd_pass(SGDRegressor(random_state=0, **params), X, y, train)
+    return model.score(X[test], y[test])
+
+def stochastic_gradient_descent(X, y, cv=5, n_jobs=-1):
     param_grid = {
-        'loss': ['squared_loss', 'huber'],
+        'loss': ['squared_error', 'huber'],
         'penalty': ['l2', 'l1', 'elasticnet'],
         'alpha': [0.0001, 0.001, 0.01],
     }
-    model = GridSearchCV(SGDRegressor(), param_grid, cv=5)
-    model.fit(X, y)
-    return model
+    # Each candidate gets a single streaming pass per fold instead of a fit to
+    # convergence; the candidate/fold pairs are independent and run in parallel
+    candidates = list(ParameterGrid(param_grid))
+    folds = list(check_cv(cv).split(X, y))
+    scores = Parallel(n_jobs=n_jobs)(delayed(sgd_fold_score)(params, X, y, train, test)
+                                     for params in candidates for train, test in folds)
+    mean_scores = np.mean(np.reshape(scores, (len(candidates), len(folds))), axis=1)
+    best = int(np.argmax(mean_scores))
+
+    # Refit the best candidate on every row; the result has the same fields as a search
+    model = sgd_pass(SGDRegressor(random_state=0, **candidates[best]), X, y, np.arange(len(y)))
+    return SimpleNamespace(best_estimator_=model, best_params_=candidates[best], best_score_=mean_scores[best])
 
-def svr_rbf(X, y):
+# The precomputed kernel is an n x n matrix, and every search worker copies the
+# train block of its fold to float64 for libsvm (about 130 MB each at 5000 rows),
+# so larger sets let SVR compute the kernel rows it needs on the fly
+SVR_KERNEL_MAX_ROWS = 5000
+
+def svr_rbf(X, y, cv=5, n_jobs=-1):
     param_grid = {
         'C': [0.1, 1, 10],
         'epsilon': [0.1, 0.2, 0.3],
-        'gamma': ['scale', 'auto']
     }
-    model = GridSearchCV(SVR(kernel='rbf'), param_grid, cv=5)
-    model.fit(X, y)
-    return model
+    if len(X) > SVR_KERNEL_MAX_ROWS:
+        model = HalvingGridSearchCV(SVR(kernel='rbf'), {**param_grid, 'gamma': ['scale', 'auto']},
+                                    cv=cv, factor=3, random_state=0, n_jobs=n_jobs)
+        model.fit(X, y)
+        return model
+
+    # The kernel matrix only depends on gamma, so it is computed once per gamma
+    # ('scale' and 'auto' resolved as SVR does) and shared by every C/epsilon fit;
+    # the search slices out the train and test blocks of each fold. Unlike SVR,
+    # which takes the 'scale' variance from each training fold, it comes from all
+    # of X here, test rows included
+    gammas = {
+        'scale': 1.0 / (X.shape[1] * X.var()),
+        'auto': 1.0 / X.shape[1]
+    }
+    best = None
+    for name, gamma in gammas.items():
+        model = HalvingGridSearchCV(SVR(kernel='precomputed'), param_grid, cv=cv, factor=3, random_state=0,
+                                    n_jobs=n_jobs)
+        model.fit(rbf_kernel(X, gamma=gamma), y)
+        if best is None or model.best_score_ > best.best_score_:
+            best = SimpleNamespace(best_estimator_=model.best_estimator_,
+                                   best_params_={**model.best_params_, 'gamma': name},
+                                   best_score_=model.best_score_)
+    return best
 
-def gradient_boost(X, y):
+def gradient_boost(X, y, cv=5, n_jobs=-1):
     param_grid = {
         'n_estimators': [50, 100, 200],
         'learning_rate': [0.01, 0.05, 0.1],
         'max_depth': [3, 4, 5],
     }
-    model = GridSearchCV(GradientBoostingRegressor(), param_grid, cv=5)
+    model = HalvingGridSearchCV(GradientBoostingRegressor(random_state=0), param_grid, cv=cv, factor=3,
+                                random_state=0, n_jobs=n_jobs)
     model.fit(X, y)
     return model
 
-def xgboost(X, y):
+def gpu_fit(booster):
+    """Returns booster, configured for the GPU, after a tiny trial fit, or None if the fit
+    fails. The NVIDIA driver being present does not mean the library has GPU support."""
+    if shutil.which('nvidia-smi') is None:
+        return None
+    X = np.arange(64, dtype=np.float32).reshape(-1, 1)
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            return booster.fit(X, X.ravel())
+    except Exception:  # XGBoostError, LightGBMError, ... depending on the build
+        return None
+
+@functools.cache
+def xgboost_on_gpu():
+    booster = gpu_fit(XGBRegressor(tree_method='hist', device='cuda', n_estimators=2))
+    if booster is None:
+        return False
+    # A build without CUDA, or one that finds no device, warns and trains on the CPU
+    # instead of raising; the fitted config records the device actually used
+    config = orjson.loads(booster.get_booster().save_config())
+    return config['learner']['generic_param']['device'].startswith('cuda')
+
+@functools.cache
+def lightgbm_on_gpu():
+    return gpu_fit(LGBMRegressor(device_type='gpu', n_estimators=2, verbose=-1)) is not None
+
+def booster_search(booster, on_gpu, param_grid, X, y, cv, n_jobs):
+    # Single-threaded booster; the search parallelizes across cores instead. On the
+    # GPU every parallel fit would open its own device context and contend for the
+    # one card, so the search runs one fit at a time there
+    model = HalvingGridSearchCV(booster, param_grid, cv=cv, factor=3, random_state=0,
+                                n_jobs=1 if on_gpu else n_jobs)
+    model.fit(X, y)
+    return model
+
+def xgboost(X, y, cv=5, n_jobs=-1):
     param_grid = {
         'n_estimators': [50, 100, 200],
         'learning_rate': [0.01, 0.05, 0.1],
         'max_depth': [3, 4, 5],
+        'max_bin': [127, 255],
     }
-    model = GridSearchCV(XGBRegressor(), param_grid, cv=5)
-    model.fit(X, y)
-    return model
+    on_gpu = xgboost_on_gpu()
+    booster = XGBRegressor(tree_method='hist', device='cuda' if on_gpu else 'cpu', n_jobs=1)
+    return booster_search(booster, on_gpu, param_grid, X, y, cv, n_jobs)
 
-def lightgbm(X, y):
+def lightgbm(X, y, cv=5, n_jobs=-1):
     param_grid = {
         'n_estimators': [50, 100, 200],
         'learning_rate': [0.01, 0.05, 0.1],
         'max_depth': [3, 4, 5],
+        'max_bin': [127, 255],
+    }
+    on_gpu = lightgbm_on_gpu()
+    booster = LGBMRegressor(device_type='gpu' if on_gpu else 'cpu', n_jobs=1)
+    return booster_search(booster, on_gpu, param_grid, X, y, cv, n_jobs)
+
+def fit_model(name, model_func, X, y, cv, n_jobs):
+    print(f"Training {name}...", flush=True)
+    # Inside a loky worker joblib would run the search's own Parallel on threads;
+    # ask for processes again, each limited to one BLAS/OpenMP thread
+    with parallel_config(backend='loky', inner_max_num_threads=1):
+        model = model_func(X, y, cv=cv, n_jobs=n_jobs)
+    return {
+        'model': name,
+        'best_params': model.best_params_,
+        'score': model.best_score_
     }
-    model = GridSearchCV(LGBMRegressor(), param_grid, cv=5)
-    model.fit(X, y)
-    return model
 
 def main(filename):
     X, y = read_data(filename)
+    # One shuffled 5-fold split shared by every model, so their scores compare like for like
+    folds = list(KFold(n_splits=5, shuffle=True, random_state=0).split(X))
     
     models = {
         "Deep Feedforward NN": deep_feedforward_nn,
@@ -100,21 +330,23 @@ def main(filename):
         "LightGBM": lightgbm
     }
     
-    results = {}
-    for name, model_func in models.items():
-        print(f"Training {name}...")
-        model = model_func(X, y)
-        results[name] = {
-            'best_params': model.best_params_,
-            'score': model.best_score_
-        }
-    
-    with open('model_results.json', 'w') as outfile:
-        json.dump(results, outfile)
+    # Train the models concurrently and split the cores between them, so the
+    # searches inside do not oversubscribe the machine
+    n_outer = min(len(models), max(1, os.cpu_count() // 4))
+    n_inner = max(1, os.cpu_count() // n_outer)
+    entries = Parallel(n_jobs=n_outer, return_as='generator_unordered')(
+        delayed(fit_model)(name, model_func, X, y, folds, n_inner) for name, model_func in models.items())
+
+    # One JSON line per model, written as soon as it finishes so a crash keeps the
+    # results of the models done so far
+    with open('model_results.jsonl', 'wb') as outfile:
+        for entry in entries:
+            outfile.write(orjson.dumps(entry, option=orjson.OPT_SERIALIZE_NUMPY) + b'\n')
+            outfile.flush()
     
 if __name__ == '__main__':
     import sys
     main(sys.argv[1])
     """
-    pip install pandas numpy scikit-learn xgboost lightgbm feather-format
+    pip install pandas numpy scikit-learn xgboost lightgbm pyarrow orjson torch
     """